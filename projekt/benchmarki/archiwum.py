@@ -0,0 +1,52 @@
+import os
+import tempfile
+import time
+import triangulacja as T
+from triangulacja.sceny import SceneRecorder
+from triangulacja.wizualizacja import Plot
+from benchmarki.wielokaty import star
+# Zapis i odczyt scen animacji: Plot.toJson / Plot(json=...) w porównaniu z
+# binarnym archiwum (Plot.saveArchive / Plot(archive=...)). Odczyt obejmuje
+# zbudowanie jednej sceny oraz wszystkich scen po kolei.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.archiwum
+
+def touch(scenes,indices):
+    total=0
+    for i in indices:
+        scene=scenes[i]
+        total+=sum(len(c.points) for c in scene.points)+sum(len(c.lines) for c in scene.lines)
+    return total
+
+def main():
+    print("%6s %7s %8s %10s %12s %12s %11s" % ("n","sceny","format","zapis [s]","1 scena [s]","wszystkie [s]","plik [MB]"))
+    with tempfile.TemporaryDirectory() as folder:
+        path=os.path.join(folder,'sceny.scen')
+        for n in [100,300]:
+            pS,imin=T.getpoints(star(n))
+            recorder=SceneRecorder()
+            T.triangulateMonotonic(pS,recorder)
+            plot=Plot([recorder.scenes[i] for i in range(len(recorder.scenes))])
+            count=len(plot.scenes)
+            start=time.perf_counter()
+            text=plot.toJson()
+            write=time.perf_counter()-start
+            start=time.perf_counter()
+            one=touch(Plot(json=text).scenes,[count-1])
+            first=time.perf_counter()-start
+            start=time.perf_counter()
+            every=touch(Plot(json=text).scenes,range(count))
+            whole=time.perf_counter()-start
+            print("%6d %7d %8s %10.3f %12.4f %12.3f %11.1f" % (n,count,"json",write,first,whole,len(text)/2**20))
+            start=time.perf_counter()
+            plot.saveArchive(path)
+            write=time.perf_counter()-start
+            start=time.perf_counter()
+            assert touch(Plot(archive=path).scenes,[count-1])==one
+            first=time.perf_counter()-start
+            start=time.perf_counter()
+            assert touch(Plot(archive=path).scenes,range(count))==every
+            whole=time.perf_counter()-start
+            print("%6d %7d %8s %10.3f %12.4f %12.3f %11.1f" % (n,count,"archiwum",write,first,whole,os.path.getsize(path)/2**20))
+
+if __name__=="__main__":
+    main()
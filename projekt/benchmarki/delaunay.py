@@ -0,0 +1,39 @@
+import time
+import numpy as np
+import triangulacja as T
+from benchmarki.wielokaty import monotone, star, comb, notched, spiral
+# Koszt poprawy triangulacji zamianami przekątnych (delaunayFlip) w stosunku do
+# samej triangulacji oraz zysk na kątach: najmniejszy kąt i średnia z
+# najmniejszych kątów trójkątów przed i po poprawie. Spirala potrzebuje
+# kwadratowo wielu zamian (wachlarze wzdłuż zwojów), więc tylko do n=10^4.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.delaunay
+
+def minAngles(xy,triangles):
+    #najmniejszy kąt każdego trójkąta w stopniach
+    a=xy[triangles]
+    sides=[a[:,(i+1)%3]-a[:,i] for i in range(3)]
+    lengths=[np.hypot(s[:,0],s[:,1]) for s in sides]
+    angles=[]
+    for i in range(3):
+        cos=-(sides[i-1]*sides[i]).sum(axis=1)/(lengths[i-1]*lengths[i])
+        angles.append(np.degrees(np.arccos(np.clip(cos,-1,1))))
+    return np.min(angles,axis=0)
+
+def main():
+    print("%-10s %7s %10s %10s %8s %16s %16s" % ("wielokąt","n","triang.","zamiany","liczba","min kąt","śr. min kąt"))
+    for g,top in [(monotone,10**5),(star,10**5),(comb,10**5),(notched,10**5),(spiral,10**4)]:
+        for n in [n for n in [10**3,10**4,10**5] if n<=top]:
+            pS,imin=T.getpoints(g(n))
+            xy=np.asarray(pS,dtype=np.float64)
+            start=time.perf_counter()
+            triangles=T.triangulatePolygon(pS,imin)
+            base=time.perf_counter()-start
+            start=time.perf_counter()
+            flipped,flips=T.delaunayFlip(pS,triangles)
+            cost=time.perf_counter()-start
+            before=minAngles(xy,triangles)
+            after=minAngles(xy,flipped)
+            print("%-10s %7d %9.3fs %9.3fs %8d %7.3f -> %6.3f %7.2f -> %6.2f" % (g.__name__,len(pS),base,cost,flips,before.min(),after.min(),before.mean(),after.mean()))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from triangulacja.geometria import getpoints
+from triangulacja.monotoniczne import triangulateMonotonic
+from triangulacja.sceny import SceneRecorder
+from triangulacja.eksport import exportFrames
+from benchmarki.wielokaty import star
+# Eksport klatek animacji triangulacji bez okna: klatki na sekundę przy
+# rysowaniu w jednym procesie i na 1..N procesach ProcessPoolExecutor.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.eksport
+# (python -m benchmarki.eksport N - liczba procesów, domyślnie liczba rdzeni)
+
+def record(n):
+    pS,imin=getpoints(star(n,3))
+    recorder=SceneRecorder()
+    triangulateMonotonic(pS,recorder)
+    return recorder.scenes
+
+def measure(scenes,workers):
+    folder=tempfile.mkdtemp()
+    try:
+        start=time.perf_counter()
+        if workers==0:
+            exportFrames(scenes,folder)
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                exportFrames(scenes,folder,executor)
+        return len(scenes)/(time.perf_counter()-start)
+    finally:
+        shutil.rmtree(folder)
+
+def main(argv=None):
+    import sys
+    argv=sys.argv[1:] if argv is None else argv
+    top=int(argv[0]) if argv else (os.cpu_count() or 1)
+    scenes=record(30)
+    print("klatek: %d" % len(scenes))
+    print("%10s %12s" % ("procesy","klatki/s"))
+    print("%10s %12.1f" % ("-",measure(scenes,0)))
+    for workers in range(1,top+1):
+        print("%10d %12.1f" % (workers,measure(scenes,workers)))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,25 @@
+import time
+import numpy as np
+import triangulacja as T
+from benchmarki.wielokaty import star
+# Klasyfikacja wierzchołków: pętla classify i wektorowe classifyVectorized
+# (osobno czas dla gotowej tablicy (n, 2) i dla listy krotek z konwersją).
+# Uruchomienie (z katalogu projekt): python -m benchmarki.klasyfikacja
+
+def measure(f,*args):
+    start=time.perf_counter()
+    f(*args)
+    return time.perf_counter()-start
+
+def main():
+    print("%9s %14s %14s %14s" % ("n","classify [s]","tablica [s]","lista [s]"))
+    for n in [10**4,10**5,10**6]:
+        pS=star(n)
+        array=np.array(pS)
+        tLoop=measure(T.classify,pS)
+        tArray=measure(T.classifyVectorized,array)
+        tList=measure(T.classifyVectorized,pS)
+        print("%9d %14.4f %14.4f %14.4f" % (n,tLoop,tArray,tList))
+
+if __name__=="__main__":
+    main()
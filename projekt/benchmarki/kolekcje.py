@@ -0,0 +1,37 @@
+import time
+import numpy as np
+from triangulacja.wizualizacja import PointsCollection
+# Dodawanie punktów po jednym (jak klikanie w trybie "Dodaj punkt") razem z
+# odczytem tablicy do rysowania po każdym kliknięciu. Poprzednia wersja
+# (sklejanie list i np.array przy każdym rysowaniu) jest w funkcji listConcat.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.kolekcje
+
+def listConcat(points):
+    collected=[]
+    for p in points:
+        collected=collected+[p]
+        xy=np.array(collected)
+    return xy
+
+def growing(points):
+    collection=PointsCollection([])
+    for p in points:
+        collection.add_points([p])
+        xy=collection.points
+    return xy
+
+def main():
+    print("%8s %12s %12s" % ("punkty","lista [s]","bufor [s]"))
+    for n in [10**3,3*10**3,10**4]:
+        points=[tuple(p) for p in np.random.default_rng(0).random((n,2)).tolist()]
+        start=time.perf_counter()
+        a=listConcat(points)
+        old=time.perf_counter()-start
+        start=time.perf_counter()
+        b=growing(points)
+        new=time.perf_counter()-start
+        assert (a==b).all()
+        print("%8d %12.4f %12.4f" % (n,old,new))
+
+if __name__=="__main__":
+    main()
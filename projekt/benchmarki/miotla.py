@@ -0,0 +1,23 @@
+import time
+import triangulacja as T
+from benchmarki.wielokaty import comb
+# Porównanie struktury stanu miotły w divide(): liniowe szukanie w StatusDict
+# i drzewo StatusTree.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.miotla
+
+def measure(pS,statestruct):
+    start=time.perf_counter()
+    diagonals=T.divide(pS,statestruct)
+    return time.perf_counter()-start,diagonals
+
+def main():
+    print("%8s %12s %12s" % ("n","dict [s]","drzewo [s]"))
+    for n in [500,1000,2000,4000,8000,16000]:
+        pS,imin=T.getpoints(comb(n))
+        tDict,dDict=measure(pS,T.StatusDict(pS)) if n<=8000 else (float("nan"),None)
+        tTree,dTree=measure(pS,T.StatusTree(pS))
+        assert dDict is None or sorted(dDict)==sorted(dTree)
+        print("%8d %12.4f %12.4f" % (len(pS),tDict,tTree))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,29 @@
+import time
+import numpy as np
+import triangulacja as T
+# Przepustowość testu orientacji: pojedyncze wywołania Det w pętli, Dets na
+# tablicach punktów i orientations na trójkach indeksów do wspólnej tablicy.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.orientacja
+
+def main():
+    rnd=np.random.default_rng(0)
+    print("%9s %16s %16s %22s" % ("m","Det [mln/s]","Dets [mln/s]","orientations [mln/s]"))
+    for m in [10**3,10**4,10**5,10**6]:
+        points=rnd.random((m,2))
+        triples=rnd.integers(0,m,(m,3))
+        A,B,C=points[triples[:,0]],points[triples[:,1]],points[triples[:,2]]
+        a,b,c=A.tolist(),B.tolist(),C.tolist()
+        start=time.perf_counter()
+        for i in range(m):
+            T.Det(a[i],b[i],c[i])
+        tLoop=time.perf_counter()-start
+        start=time.perf_counter()
+        T.Dets(A,B,C)
+        tBatch=time.perf_counter()-start
+        start=time.perf_counter()
+        T.orientations(points,triples)
+        tIndex=time.perf_counter()-start
+        print("%9d %16.1f %16.1f %22.1f" % (m,m/tLoop/10**6,m/tBatch/10**6,m/tIndex/10**6))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,37 @@
+import time
+import tracemalloc
+import numpy as np
+import triangulacja as T
+from benchmarki.wielokaty import star
+# Pamięć na wierzchołek: lista krotek (x, y) i Polygon, oraz szczytowe zużycie
+# pamięci podczas getpoints + divide dla obu postaci wielokąta.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.pamiec
+
+def traced(f):
+    tracemalloc.start()
+    start=time.perf_counter()
+    result=f()
+    elapsed=time.perf_counter()-start
+    current,peak=tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result,current,peak,elapsed
+
+def main():
+    n=10**6
+    xy=np.array(star(n))
+    pS,listBytes,_,_=traced(lambda: [tuple(p) for p in xy.tolist()])
+    polygonBytes=T.Polygon(xy).nbytes()
+    print("przechowywanie, n=%d:" % n)
+    print("  lista krotek %8.1f B/wierzchołek" % (listBytes/n))
+    print("  Polygon      %8.1f B/wierzchołek" % (polygonBytes/n))
+    n=10**5
+    xy=np.array(star(n))
+    pS=[tuple(p) for p in xy.tolist()]
+    polygon=T.Polygon(xy)
+    print("getpoints + divide, n=%d:" % n)
+    for name,p in [("lista krotek",pS),("Polygon",polygon)]:
+        _,_,peak,elapsed=traced(lambda: T.divide(T.getpoints(p)[0]))
+        print("  %-12s szczyt %8.1f B/wierzchołek, czas %.2f s" % (name,peak/n,elapsed))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,51 @@
+import random
+import time
+import triangulacja as T
+# Odporny test orientacji: czas wywołania Det i orient, odsetek trójek
+# rozstrzygniętych szybkim filtrem (orientFast) oraz liczba błędnych znaków Det
+# w porównaniu z dokładnym orientExact.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.predykaty
+
+def uniform(rnd,m):
+    return [tuple((rnd.random(),rnd.random()) for _ in range(3)) for _ in range(m)]
+
+def utm(rnd,m):
+    #współrzędne rzędu setek tysięcy i milionów metrów, trójkąty ~kilometrowe
+    return [tuple((500000+1000*rnd.random(),5000000+1000*rnd.random()) for _ in range(3)) for _ in range(m)]
+
+def utmCollinear(rnd,m):
+    #prawie współliniowe punkty w układzie UTM (np. kolejne wierzchołki prostej ściany budynku)
+    triples=[]
+    for _ in range(m):
+        x,y=500000+1000*rnd.random(),5000000+1000*rnd.random()
+        dx,dy=rnd.random(),rnd.random()
+        triples.append(tuple((x+t*dx+rnd.choice((-1,0,1))*10**(-10),y+t*dy) for t in (0.0,rnd.random()*10,rnd.random()*20)))
+    return triples
+
+def utmExact(rnd,m):
+    #dokładnie współliniowe punkty na siatce 0,25 m - tu filtr nie wystarcza
+    triples=[]
+    for _ in range(m):
+        x,y=500000+rnd.randrange(4000)/4,5000000+rnd.randrange(4000)/4
+        dx,dy=rnd.randrange(1,8)/4,rnd.randrange(1,8)/4
+        triples.append(tuple((x+t*dx,y+t*dy) for t in (0,rnd.randrange(1,50),rnd.randrange(50,100))))
+    return triples
+
+def main():
+    rnd=random.Random(0)
+    m=100000
+    print("%22s %12s %12s %14s %12s" % ("dane","Det [us]","orient [us]","szybka ścieżka","błędy Det"))
+    for name,generate in [("losowe",uniform),("UTM",utm),("UTM współliniowe",utmCollinear),("UTM dokładnie współl.",utmExact)]:
+        triples=generate(rnd,m)
+        start=time.perf_counter()
+        dets=[T.Det(a,b,c) for a,b,c in triples]
+        tDet=time.perf_counter()-start
+        start=time.perf_counter()
+        signs=[T.orient(a,b,c) for a,b,c in triples]
+        tOrient=time.perf_counter()-start
+        fast=sum(T.orientFast(a,b,c) is not None for a,b,c in triples)
+        wrong=sum(((d>0)-(d<0))!=s for d,s in zip(dets,signs))
+        print("%22s %12.3f %12.3f %13.2f%% %12d" % (name,tDet/m*10**6,tOrient/m*10**6,100*fast/m,wrong))
+
+if __name__=="__main__":
+    main()
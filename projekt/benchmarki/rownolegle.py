@@ -0,0 +1,32 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import triangulacja as T
+from benchmarki.wielokaty import star
+# Skalowanie triangulacji wielokątów monotonicznych (triangulatePieces) z liczbą
+# procesów. Podział na wielokąty monotoniczne jest liczony raz, poza pomiarem.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.rownolegle
+
+def main():
+    n=2*10**5
+    pS=T.Polygon(T.getpoints(star(n))[0])
+    faces=T.monotonicFaces(pS)
+    start=time.perf_counter()
+    serial=T.triangulatePieces(pS,faces)
+    base=time.perf_counter()-start
+    print("n=%d, wielokątów monotonicznych: %d" % (n,len(faces)))
+    print("%8s %12s %10s" % ("procesy","czas [s]","przysp."))
+    print("%8s %12.4f %10.2f" % ("-",base,1.0))
+    workers=1
+    while workers<=(os.cpu_count() or 1):
+        with ProcessPoolExecutor(workers) as executor:
+            executor.submit(int).result()#uruchomienie procesów poza pomiarem
+            start=time.perf_counter()
+            triangles=T.triangulatePieces(pS,faces,executor)
+            elapsed=time.perf_counter()-start
+        assert (triangles==serial).all()
+        print("%8d %12.4f %10.2f" % (workers,elapsed,base/elapsed))
+        workers*=2
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,80 @@
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import matplotlib.collections as mcoll
+import numpy as np
+from triangulacja.wizualizacja import _Button_callback, Scene, PointsCollection, LinesCollection
+# Rysowanie dużych scen bez okna (Agg): przejście do kolejnej sceny i klikanie
+# w trybie "Dodaj punkt". Poprzednia metoda draw (czyszczenie osi i tworzenie
+# wszystkich artystów od nowa) jest odtworzona w funkcji clearAndRedraw.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.rysowanie
+
+def clearAndRedraw(callback,autoscaling=True):
+    ax=callback.ax
+    if not autoscaling:
+        xlim=ax.get_xlim()
+        ylim=ax.get_ylim()
+    ax.clear()
+    for collection in (callback.scenes[callback.i].points+callback.added_points):
+        if len(collection.points)>0:
+            ax.scatter(*zip(*(np.array(collection.points))),**collection.kwargs)
+    for collection in (callback.scenes[callback.i].lines+callback.added_lines+callback.added_rects):
+        ax.add_collection(mcoll.LineCollection(collection.lines,**collection.kwargs))
+    ax.autoscale(autoscaling)
+    if not autoscaling:
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+    ax.figure.canvas.draw()
+
+class Click:
+    def __init__(self,ax,x,y):
+        self.inaxes=ax
+        self.xdata=x
+        self.ydata=y
+
+def makeScenes(n,count):
+    rnd=np.random.default_rng(0)
+    scenes=[]
+    for k in range(count):
+        pts=[tuple(p) for p in rnd.random((n,2)).tolist()]
+        scenes.append(Scene([PointsCollection(pts,color='blue')],[LinesCollection(list(zip(pts[:-1],pts[1:])),color='grey')]))
+    return scenes
+
+def measure(scenes,old,steps=3,clicks=10):
+    fig=plt.figure()
+    ax=plt.axes(autoscale_on=False)
+    callback=_Button_callback(scenes)
+    callback.set_axes(ax)
+    callback.draw()
+    fig.canvas.draw()
+    start=time.perf_counter()
+    for k in range(steps):
+        callback.i=(callback.i+1)%len(scenes)
+        if old:
+            clearAndRedraw(callback)
+        else:
+            callback.draw()#Agg rysuje od razu w draw_idle
+    step=(time.perf_counter()-start)/steps
+    callback.add_point(None)
+    start=time.perf_counter()
+    for k in range(clicks):
+        if old:
+            callback.added_points[-1].add_points([(k/clicks,0.5)])
+            clearAndRedraw(callback,autoscaling=False)
+        else:
+            callback.on_click(Click(ax,k/clicks,0.5))
+    click=(time.perf_counter()-start)/clicks
+    plt.close(fig)
+    return step,click
+
+def main():
+    print("%8s %14s %14s %14s %14s" % ("punkty","scena stara","scena nowa","klik stary","klik nowy"))
+    for n in [10**3,10**4,10**5]:
+        scenes=makeScenes(n,3)
+        oldStep,oldClick=measure(scenes,True)
+        newStep,newClick=measure(scenes,False)
+        print("%8d %12.1fms %12.1fms %12.1fms %12.1fms" % (n,oldStep*1000,newStep*1000,oldClick*1000,newClick*1000))
+
+if __name__=="__main__":
+    main()
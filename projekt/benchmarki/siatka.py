@@ -0,0 +1,46 @@
+import os
+import tempfile
+import time
+import numpy as np
+import triangulacja as T
+from benchmarki.wielokaty import monotone
+# Zapis i odczyt wyniku triangulacji: tekst w formacie wyniki.txt (TriangleWriter)
+# i binarna siatka (writeMesh / readMesh). Odczyt tekstu to parsowanie liczb z
+# powrotem do tablicy, odczyt siatki - memmap i suma po wszystkich danych.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.siatka
+
+def readText(path):
+    with open(path) as f:
+        text=f.read()
+    return np.array(text.translate(str.maketrans('(),\t\n','     ')).split(),dtype=np.float64).reshape(-1,3,2)
+
+def main():
+    print("%9s %8s %12s %12s %12s" % ("n","format","zapis [s]","odczyt [s]","plik [MB]"))
+    with tempfile.TemporaryDirectory() as folder:
+        text=os.path.join(folder,'wyniki.txt')
+        mesh=os.path.join(folder,'wyniki.trim')
+        for n in [10**4,10**5,10**6]:
+            pS,imin=T.getpoints(monotone(n))
+            triangles=np.array(T.Triangulate(pS,imin),dtype=np.int32)
+            coords=np.array(pS)
+            start=time.perf_counter()
+            with T.TriangleWriter(text) as writer:
+                writer.write(coords,triangles)
+            write=time.perf_counter()-start
+            start=time.perf_counter()
+            corners=readText(text)
+            read=time.perf_counter()-start
+            print("%9d %8s %12.4f %12.4f %12.1f" % (n,"txt",write,read,os.path.getsize(text)/2**20))
+            start=time.perf_counter()
+            T.writeMesh(mesh,coords,triangles)
+            write=time.perf_counter()-start
+            start=time.perf_counter()
+            vertices,loaded=T.readMesh(mesh)
+            total=vertices.sum()+loaded.sum()
+            read=time.perf_counter()-start
+            assert (vertices[loaded]==corners).all()
+            print("%9d %8s %12.4f %12.4f %12.1f" % (n,"siatka",write,read,os.path.getsize(mesh)/2**20))
+            del vertices,loaded
+
+if __name__=="__main__":
+    main()
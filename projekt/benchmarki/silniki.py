@@ -0,0 +1,32 @@
+import math
+import time
+import triangulacja as T
+from benchmarki.wielokaty import monotone, star, comb, notched, spiral
+# Porównanie silników triangulacji (triangulacja.silniki) na wielokątach
+# testowych: czas każdego silnika i silnik wybrany przez engine='auto'.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.silniki
+
+def rotated(n,seed=0):
+    #wielokąt monotoniczny obrócony o 0.7 rad - monotoniczny tylko względem
+    #kierunku pochyłego
+    c,s=math.cos(0.7),math.sin(0.7)
+    return [(c*x-s*y,s*x+c*y) for x,y in monotone(n,seed)]
+
+def main():
+    n=5000
+    print("%-10s %8s" % ("wielokąt","auto")+"".join(" %10s" % e for e in T.ENGINES))
+    for g in [monotone,rotated,star,comb,notched,spiral]:
+        pS,imin=T.getpoints(g(n))
+        cells=[]
+        for engine in T.ENGINES:
+            if (engine=='monotone' and not T.monotonic(pS,imin)) or (engine=='direction' and T.monotoneDirection(pS) is None):
+                cells.append("-")
+                continue
+            start=time.perf_counter()
+            triangles=T.triangulatePolygon(pS,imin,engine)
+            cells.append("%.3fs" % (time.perf_counter()-start))
+            assert len(triangles)==len(pS)-2
+        print("%-10s %8s" % (g.__name__,T.selectEngine(pS,imin))+"".join(" %10s" % c for c in cells))
+
+if __name__=="__main__":
+    main()
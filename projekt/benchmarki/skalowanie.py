@@ -0,0 +1,137 @@
+import argparse
+import json
+import math
+import platform
+import time
+import tracemalloc
+import numpy as np
+import triangulacja as T
+from triangulacja.polkrawedzie import HalfEdges
+from triangulacja.wielokat import subPolygon
+from benchmarki.wielokaty import monotone, star, spiral, comb, notched
+# Zestaw pomiarów skalowania: dla każdego generatora (z ustalonym ziarnem) i
+# n = 10^2 ... 10^6 mierzone są osobno etapy klasyfikacji (divideEvents),
+# podziału przekątnymi (divide z typami z klasyfikacji), wycinania wielokątów
+# monotonicznych (makeMonotonicTab bez ponownego divide) i triangulacji
+# (Triangulate na każdym kawałku). Dla każdego etapu: czas (najlepszy z --repeat), szczytowa pamięć
+# (tracemalloc, osobny przebieg) i dopasowany wykładnik k w t ~ n^k.
+# Wyniki można zapisać do JSON (--save) i porównać z poprzednim zapisem
+# (--compare), np. przed i po zmianie w kodzie.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.skalowanie
+# (python -m benchmarki.skalowanie --max 100000 --save wyniki.json)
+GENERATORS={'monotone':monotone,'star':star,'spiral':spiral,'comb':comb,'notched':notched}
+STAGES=['classify','divide','makeMonotonicTab','Triangulate']
+
+def classifyStage(pS,state):
+    state['events']=T.divideEvents(pS)
+def divideStage(pS,state):
+    state['diagonals']=T.divide(pS,types=state['events'][1])
+def monotonicStage(pS,state):
+    state['pieces']=[subPolygon(pS,face) for face in HalfEdges(pS,state['diagonals']).faces()]
+def triangulateStage(pS,state):
+    triangles=0
+    for m in state['pieces']:
+        imax,imin=T.extremes(m)
+        triangles+=len(T.Triangulate(m,imin,None,imax))
+    assert triangles==len(pS)-2
+STEPS=[classifyStage,divideStage,monotonicStage,triangulateStage]
+
+def timed(pS,repeat):
+    #najlepszy czas każdego etapu z repeat przebiegów całego potoku
+    best=[math.inf]*len(STEPS)
+    for r in range(repeat):
+        state={}
+        for k,step in enumerate(STEPS):
+            start=time.perf_counter()
+            step(pS,state)
+            best[k]=min(best[k],time.perf_counter()-start)
+    return best
+def traced(pS):
+    #szczytowa pamięć każdego etapu ponad to, co zostało po poprzednich
+    peaks=[]
+    state={}
+    tracemalloc.start()
+    for step in STEPS:
+        tracemalloc.reset_peak()
+        base=tracemalloc.get_traced_memory()[0]
+        step(pS,state)
+        peaks.append(tracemalloc.get_traced_memory()[1]-base)
+    tracemalloc.stop()
+    return peaks
+def exponent(ns,ts):
+    #k z dopasowania log t = k log n + c metodą najmniejszych kwadratów
+    points=[(math.log(n),math.log(t)) for n,t in zip(ns,ts) if n>=1000 and t>0]
+    if len(points)<2:
+        points=[(math.log(n),math.log(t)) for n,t in zip(ns,ts) if t>0]
+    if len(points)<2:
+        return float('nan')
+    x,y=np.array(points).T
+    return float(np.polyfit(x,y,1)[0])
+
+def run(generators,sizes,repeat,memory,seed):
+    results={'python':platform.python_version(),'numpy':np.__version__,'seed':seed,'sizes':sizes,'generators':{}}
+    for name in generators:
+        rows=[]
+        for n in sizes:
+            pS,imin=T.getpoints(GENERATORS[name](n,seed))
+            row={'n':len(pS),'time':timed(pS,repeat)}
+            if memory:
+                row['peak']=traced(pS)
+            rows.append(row)
+            report(name,row)
+        ns=[row['n'] for row in rows]
+        fit=[exponent(ns,[row['time'][k] for row in rows]) for k in range(len(STAGES))]
+        results['generators'][name]={'rows':rows,'exponent':fit}
+        print("%-10s %9s" % (name,"n^k")+"".join(" %16.2f" % k for k in fit))
+    return results
+def report(name,row):
+    cells=["%.4fs" % t+(" %5.0fB" % (p/row['n']) if 'peak' in row else "") for t,p in zip(row['time'],row.get('peak',row['time']))]
+    print("%-10s %9d" % (name,row['n'])+"".join(" %16s" % c for c in cells))
+def compare(results,baseline,threshold):
+    #stosunek czasów do zapisu bazowego dla wspólnych generatorów i n;
+    #zwraca liczbę pomiarów wolniejszych o więcej niż threshold
+    slower=0
+    print("\nporównanie z zapisem bazowym (czas nowy / bazowy):")
+    for name,data in results['generators'].items():
+        if name not in baseline['generators']:
+            continue
+        old={row['n']:row for row in baseline['generators'][name]['rows']}
+        for row in data['rows']:
+            if row['n'] not in old:
+                continue
+            ratios=[t/o if o>0 else float('nan') for t,o in zip(row['time'],old[row['n']]['time'])]
+            flags=["!" if r>1+threshold else " " for r in ratios]
+            slower+=flags.count("!")
+            print("%-10s %9d" % (name,row['n'])+"".join(" %15.2f%s" % (r,f) for r,f in zip(ratios,flags)))
+    return slower
+
+def main(argv=None):
+    parser=argparse.ArgumentParser(prog='python -m benchmarki.skalowanie')
+    parser.add_argument('--generators',nargs='+',choices=list(GENERATORS),default=list(GENERATORS))
+    parser.add_argument('--min',type=int,default=100)
+    parser.add_argument('--max',type=int,default=10**6)
+    parser.add_argument('--repeat',type=int,default=3)
+    parser.add_argument('--seed',type=int,default=0)
+    parser.add_argument('--no-memory',dest='memory',action='store_false')
+    parser.add_argument('--save')
+    parser.add_argument('--compare')
+    parser.add_argument('--threshold',type=float,default=0.2)
+    args=parser.parse_args(argv)
+    sizes=[]
+    n=args.min
+    while n<=args.max:
+        sizes.append(n)
+        n*=10
+    print("czas etapu [s]"+(" i szczyt pamięci [B/wierzchołek]" if args.memory else ""))
+    print("%-10s %9s" % ("generator","n")+"".join(" %16s" % s for s in STAGES))
+    results=run(args.generators,sizes,args.repeat,args.memory,args.seed)
+    if args.save:
+        with open(args.save,'w') as f:
+            json.dump(results,f,indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            slower=compare(results,json.load(f),args.threshold)
+        print("wolniej o ponad %d%%: %d" % (args.threshold*100,slower))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,29 @@
+import time
+import tracemalloc
+import triangulacja as T
+from triangulacja.sceny import SceneRecorder
+from benchmarki.wielokaty import star
+# Koszt budowania scen: triangulateMonotonic bez obserwatora i z SceneRecorder
+# (czas oraz pamięć zajęta przez zapamiętane klatki).
+# Uruchomienie (z katalogu projekt): python -m benchmarki.sledzenie
+
+def measure(pS,observer=None):
+    start=time.perf_counter()
+    T.triangulateMonotonic(pS,observer)
+    return time.perf_counter()-start
+
+def main():
+    print("%8s %14s %14s %10s %12s" % ("n","bez scen [s]","ze scenami [s]","klatki","pamięć [MB]"))
+    for n in [250,500,1000,2000,4000]:
+        pS,imin=T.getpoints(star(n))
+        tPlain=measure(pS)
+        recorder=SceneRecorder()
+        tTrace=measure(pS,recorder)
+        tracemalloc.start()
+        T.triangulateMonotonic(pS,SceneRecorder())
+        memory=tracemalloc.get_traced_memory()[1]/2**20
+        tracemalloc.stop()
+        print("%8d %14.4f %14.4f %10d %12.2f" % (n,tPlain,tTrace,len(recorder.scenes),memory))
+
+if __name__=="__main__":
+    main()
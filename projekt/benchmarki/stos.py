@@ -0,0 +1,18 @@
+import time
+import triangulacja as T
+from benchmarki.wielokaty import monotone
+# Czas Triangulate w przeliczeniu na wierzchołek dla dużych wielokątów monotonicznych.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.stos
+
+def main():
+    print("%9s %12s %14s" % ("n","czas [s]","na wierzch. [ns]"))
+    for n in [10**4,10**5,10**6]:
+        pS,imin=T.getpoints(monotone(n))
+        start=time.perf_counter()
+        triangles=T.Triangulate(pS,imin)
+        elapsed=time.perf_counter()-start
+        assert len(triangles)==n-2
+        print("%9d %12.4f %14.0f" % (n,elapsed,elapsed/n*10**9))
+
+if __name__=="__main__":
+    main()
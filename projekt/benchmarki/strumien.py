@@ -0,0 +1,35 @@
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+import triangulacja as T
+from benchmarki.wielokaty import star
+# Strumieniowa triangulacja pliku GeoJSON (w wierszach): czas i szczytowe
+# zużycie pamięci. Szczyt zależy od rozmiaru paczki, a nie od rozmiaru pliku.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.strumien
+
+def writeStars(path,count):
+    with open(path,'w') as f:
+        for k in range(count):
+            p=star(12,k)
+            f.write(json.dumps({'type':'Polygon','coordinates':[[list(q) for q in p+[p[0]]]]})+'\n')
+
+def main():
+    print("%10s %12s %10s %12s" % ("wielokąty","plik [MB]","czas [s]","szczyt [MB]"))
+    with tempfile.TemporaryDirectory() as folder:
+        source=os.path.join(folder,'wielokaty.geojsonl')
+        target=os.path.join(folder,'trojkaty.txt')
+        for count in [10**3,10**4,3*10**4]:
+            writeStars(source,count)
+            tracemalloc.start()
+            start=time.perf_counter()
+            triangles=T.triangulateFile(source,target)
+            elapsed=time.perf_counter()-start
+            peak=tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert triangles==10*count
+            print("%10d %12.1f %10.2f %12.1f" % (count,os.path.getsize(source)/2**20,elapsed,peak/2**20))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,80 @@
+import math
+import random
+# Generatory wielokątów testowych. Wszystkie zwracają listę punktów (x, y)
+# uszeregowanych przeciwnie do ruchu wskazówek zegara, tak jak po narysowaniu
+# figury myszką. Drobne losowe zaburzenie współrzędnych (z ustalonym ziarnem)
+# zapobiega powtarzającym się wysokościom wierzchołków.
+
+def star(n,seed=0):
+    #wielokąt gwiaździsty - losowe promienie przy rosnącym kącie
+    rnd=random.Random(seed)
+    pS=[]
+    for i in range(n):
+        r=0.5+rnd.random()
+        pS.append((r*math.cos(2*math.pi*i/n),r*math.sin(2*math.pi*i/n)))
+    return pS
+
+def comb(n,seed=0):
+    #podwójny grzebień - zęby u góry (wierzchołki łączące między nimi) i u dołu
+    #(wierzchołki dzielące), dużo krawędzi jednocześnie w strukturze stanu
+    rnd=random.Random(seed)
+    k=max(n//4,2)
+    e=lambda: rnd.random()*10**(-3)
+    pS=[]
+    for j in range(k):
+        pS.append((j+0.5,-2+e()))
+        if j<k-1:
+            pS.append((j+1,-1+e()))
+    for j in range(k-1,-1,-1):
+        pS.append((j+0.5,2+e()))
+        if j>0:
+            pS.append((j,1+e()))
+    return pS
+
+def monotone(n,seed=0):
+    #losowy wielokąt y-monotoniczny - lewy łańcuch w dół, prawy w górę
+    rnd=random.Random(seed)
+    ys=sorted((rnd.random() for _ in range(n-2)),reverse=True)
+    left=[]
+    right=[]
+    for y in ys:
+        if rnd.random()<0.5:
+            left.append((-rnd.random()-0.1,y))
+        else:
+            right.append((rnd.random()+0.1,y))
+    return [(0.0,1.0)]+left+[(0.0,0.0)]+right[::-1]
+
+def spiral(n,seed=0):
+    #spirala - pas o stałej szerokości nawinięty 3 razy; na zewnątrz po zewnętrznym
+    #brzegu i z powrotem po wewnętrznym, długie łańcuchy i dużo wierzchołków
+    #dzielących/łączących na kolejnych zwojach
+    rnd=random.Random(seed)
+    k=max(n//2,3)
+    turns=3
+    pS=[]
+    for i in range(k):
+        t=2*math.pi*turns*i/(k-1)+rnd.random()*10**(-9)
+        r=1+t/(2*math.pi)
+        pS.append((r*math.cos(t),r*math.sin(t)))
+    for i in range(k-1,-1,-1):
+        t=2*math.pi*turns*i/(k-1)+rnd.random()*10**(-9)
+        r=0.5+t/(2*math.pi)
+        pS.append((r*math.cos(t),r*math.sin(t)))
+    return pS
+
+def notched(n,seed=0):
+    #grzebień z wcięciami o losowej głębokości - wierzchołki dzielące (od dołu)
+    #i łączące (od góry) na różnych wysokościach, przeplatające się w miotle
+    rnd=random.Random(seed)
+    k=max(n//4,2)
+    e=lambda: rnd.random()*10**(-3)
+    pS=[]
+    for j in range(k):
+        pS.append((j+0.5,-2+e()))
+        if j<k-1:
+            pS.append((j+1,-1.9+1.85*rnd.random()))
+    for j in range(k-1,-1,-1):
+        pS.append((j+0.5,2+e()))
+        if j>0:
+            pS.append((j,0.05+1.85*rnd.random()))
+    return pS
@@ -0,0 +1,46 @@
+import random
+import time
+import numpy as np
+import triangulacja as T
+from benchmarki.wielokaty import star, comb
+# Wiele małych wielokątów (jak obrysy budynków): triangulateBatch na tablicy
+# postrzępionej w porównaniu z pętlą wywołującą triangulateMonotonic dla
+# każdego wielokąta osobno.
+# Uruchomienie (z katalogu projekt): python -m benchmarki.wsadowe
+
+def footprints(count,seed=0):
+    #losowe małe wielokąty - prostokąty, gwiazdy i grzebienie po 4..16 wierzchołków
+    rnd=random.Random(seed)
+    polygons=[]
+    for k in range(count):
+        kind=rnd.random()
+        if kind<0.4:
+            w,h=rnd.random()+0.1,rnd.random()+0.1
+            polygons.append([(0.0,0.0),(w,0.0),(w,h),(0.0,h)])
+        elif kind<0.8:
+            polygons.append(star(rnd.randint(5,16),k))
+        else:
+            polygons.append(comb(rnd.randint(8,16),k))
+    coords=np.array([p for polygon in polygons for p in polygon],dtype=np.float64)
+    offsets=np.cumsum([0]+[len(polygon) for polygon in polygons])
+    return polygons,coords,offsets
+
+def main():
+    print("%10s %12s %12s" % ("wielokąty","pętla [s]","wsadowo [s]"))
+    for count in [10**3,10**4,10**5]:
+        polygons,coords,offsets=footprints(count)
+        start=time.perf_counter()
+        if count<=10**4:
+            for polygon in polygons:
+                T.triangulateMonotonic(T.getpoints(polygon)[0])
+            loop=time.perf_counter()-start
+        else:
+            loop=float("nan")
+        start=time.perf_counter()
+        triangles,toffsets=T.triangulateBatch(coords,offsets)
+        batch=time.perf_counter()-start
+        assert len(triangles)==len(coords)-2*count
+        print("%10d %12.4f %12.4f" % (count,loop,batch))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,2 @@
+# Testy (python -m pytest z katalogu projekt) importują pakiet triangulacja z tego
+# katalogu - pytest dopisuje go do sys.path, bo leży tu conftest.py.
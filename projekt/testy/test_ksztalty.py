@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+import triangulacja as T
+# Obrysy prostokątne (poziome i pionowe krawędzie - remisy wysokości sąsiednich
+# wierzchołków) oraz ich odbicia, w początku układu i przy współrzędnych UTM, gdzie
+# suma pól liczona wprost traci znak. Triangulacja jest poprawna, gdy ma n-2
+# trójkątów o łącznym polu równym polu wielokąta.
+#wierzchołki na równej wysokości, ale nie sąsiednie - divide dzielił je poziomą przekątną
+TIES=[(-7,5),(-5,-5),(-3,-9),(4,-5),(10,-13),(5,-5),(4,-4),(17,-3)]
+SHAPES={
+    'T':[(1,0),(2,0),(2,2),(3,2),(3,3),(0,3),(0,2),(1,2)],
+    'U':[(0,0),(3,0),(3,3),(2,3),(2,1),(1,1),(1,3),(0,3)],
+    'H':[(0,0),(1,0),(1,1),(2,1),(2,0),(3,0),(3,3),(2,3),(2,2),(1,2),(1,3),(0,3)],
+    'L':[(0,0),(2,0),(2,1),(1,1),(1,3),(0,3)],
+    'E':[(0,0),(3,0),(3,1),(1,1),(1,2),(3,2),(3,3),(1,3),(1,4),(3,4),(3,5),(0,5)],
+    'rev':[(2,6),(0,5),(0,2),(2,1),(3,0),(5,1),(3,5),(3,3)],
+    'comb':[(0,0),(7,0),(7,3),(6,3),(6,1),(5,1),(5,3),(4,3),(4,1),(3,1),(3,3),(2,3),(2,1),(1,1),(1,3),(0,3)],
+    'notches':[(0,0),(6,0),(6,2),(5,2),(5,3),(6,3),(6,5),(0,5),(0,3),(1,3),(1,2),(0,2)],
+    'stairs':[(0,0),(2,0),(2,1),(4,1),(4,0),(6,0),(6,2),(5,2),(5,3),(3,3),(3,2),(1,2),(1,3),(0,3)],
+    'ties':TIES,
+}
+for name in list(SHAPES):
+    SHAPES[name+'^']=[(x,-y) for x,y in SHAPES[name]][::-1]
+    SHAPES[name+'>']=[(y,x) for x,y in SHAPES[name]][::-1]
+    SHAPES[name+'cw']=SHAPES[name][::-1]
+PLACES=[((0,0),1.0),((512345,5512345),1.0),((512345,5512345),0.01)]
+
+def place(name,offset,scale):
+    return [(offset[0]+x*scale,offset[1]+y*scale) for x,y in SHAPES[name]]
+def area(xy):
+    xy=np.asarray(xy,dtype=np.float64)
+    xy=xy-xy[0]
+    return abs(np.sum(xy[:,0]*np.roll(xy[:,1],-1)-np.roll(xy[:,0],-1)*xy[:,1]))/2
+def check(xy,triangles):
+    xy=np.asarray(xy,dtype=np.float64)
+    xy=xy-xy[0]
+    t=xy[np.asarray(triangles,dtype=np.intp).reshape(-1,3)]
+    areas=np.abs((t[:,1,0]-t[:,0,0])*(t[:,2,1]-t[:,0,1])-(t[:,2,0]-t[:,0,0])*(t[:,1,1]-t[:,0,1]))/2
+    assert len(t)==len(xy)-2
+    assert areas.sum()==pytest.approx(area(xy),rel=1e-9)
+
+@pytest.mark.parametrize('offset,scale',PLACES)
+@pytest.mark.parametrize('name',sorted(SHAPES))
+def test_batch(name,offset,scale):
+    xy=place(name,offset,scale)
+    triangles,toffsets=T.triangulateBatch(np.array(xy),[0,len(xy)])
+    check(xy,triangles)
+
+@pytest.mark.parametrize('offset,scale',PLACES)
+def test_batch_all(offset,scale):
+    polygons=[place(name,offset,scale) for name in sorted(SHAPES)]
+    offsets=np.cumsum([0]+[len(p) for p in polygons])
+    coords=np.concatenate([np.array(p) for p in polygons])
+    with ThreadPoolExecutor(2) as executor:
+        triangles,toffsets=T.triangulateBatch(coords,offsets,executor,chunks=3)
+    for k,p in enumerate(polygons):
+        check(p,triangles[toffsets[k]:toffsets[k+1]]-offsets[k])
+
+@pytest.mark.parametrize('offset,scale',PLACES)
+@pytest.mark.parametrize('name',sorted(SHAPES))
+def test_polygon(name,offset,scale):
+    pS,imin=T.getpoints(place(name,offset,scale))
+    for engine in ('auto','sweep','ears'):
+        check(pS,T.triangulatePolygon(pS,imin,engine))
+    index={p:i for i,p in enumerate(pS)}
+    check(pS,[[index[p] for p in t] for t in T.triangulateMonotonic(pS)])
+
+@pytest.mark.parametrize('points',[TIES,TIES[::-1]])
+def test_ties(points):
+    pS,imin=T.getpoints(points)
+    assert area(pS)==137
+    for engine in ('auto','sweep','ears'):
+        check(pS,T.triangulatePolygon(pS,imin,engine))
+    index={p:i for i,p in enumerate(pS)}
+    check(pS,[[index[p] for p in t] for t in T.triangulateMonotonic(pS)])
+    polygon=T.Polygon(np.array(points,dtype=np.float64))
+    check(points,T.triangulateMonotonic(T.getpoints(polygon)[0]))
+
+def test_clockwise_divide():
+    pS,imin=T.getpoints(TIES[::-1])
+    with pytest.raises(ValueError):
+        T.divide(pS)
+
+@pytest.mark.parametrize('name',sorted(SHAPES))
+def test_scan(name):
+    pS,imin=T.getpoints(SHAPES[name])
+    pS=T.counterclockwise(pS,imin)[0]
+    types,imax,imin,monotone=T.vertexScan(pS)
+    assert np.array_equal(types,T.vertexTypes(pS))
+    assert (imax,imin)==T.extremes(pS)
+    assert monotone==T.monotonic(pS,imin)
+    assert np.array_equal(T.divide(pS,types=types),T.divide(pS))
+
+def test_polygon_array():
+    polygon=T.Polygon(np.array(TIES,dtype=np.float64))
+    assert np.asarray(polygon) is polygon.xy
+    for copy in (np.array(polygon),np.array(polygon,dtype=np.float32)):
+        copy[0]=0
+        assert polygon.xy[0].tolist()==list(TIES[0])
+
+def test_profile():
+    pS,imin=T.getpoints(TIES)
+    triangles,report=T.triangulateMonotonic(pS,profile=True)
+    index={p:i for i,p in enumerate(pS)}
+    check(pS,[[index[p] for p in t] for t in triangles])
+    assert report.counters['triangles']==len(pS)-2
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            T.triangulateMonotonic(pS,executor=executor,profile=True)
+    with pytest.raises(ValueError):
+        T.triangulateMonotonic(pS,T.Observer(),profile=True)
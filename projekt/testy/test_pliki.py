@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+from triangulacja.pliki import readWKT
+
+def test_wkt():
+    rings=list(readWKT(["POLYGON ((0 0, 4 0, 4 3, 0 0))","","polygon( ( 0 0 , 4 0 , 4 3 ) )"]))
+    assert len(rings)==2
+    for ring in rings:
+        assert np.array_equal(ring,[[0,0],[4,0],[4,3]])
+
+def test_wkt_empty():
+    assert list(readWKT(["POLYGON EMPTY"]))==[]
+
+@pytest.mark.parametrize('line',["POLYGON ((0 0, 4 0, 4 3, 0 3, 0 0) , (1 1, 2 1, 2 2, 1 1))","POLYGON ((0 0, 4 0, 4 3, 0 3, 0 0),(1 1, 2 1, 2 2, 1 1))"])
+def test_wkt_holes(line):
+    with pytest.raises(ValueError,match="dziurami"):
+        list(readWKT([line]))
@@ -0,0 +1,18 @@
+# Pakiet z triangulacją wielokątów prostych. Rdzeń geometryczny nie importuje
+# matplotliba - wizualizacja jest w module wizualizacja i ładuje go dopiero
+# przy rysowaniu. Tryb interaktywny: python -m triangulacja
+from .geometria import Det, classify, getpoints, heights, extremes, orientation, counterclockwise, chainOrder, monotonic, monotoneDirection, valid, divide_classify, divideEvents
+from .predykaty import orient, orientFast, orientExact, incircle
+from .wektorowe import levels, Dets, orientations, orientSigns, vertexTypes, vertexScan, classifyVectorized
+from .wielokat import Polygon
+from .struktury import StatusTree, StatusDict
+from .podzial import divide, makeMonotonicTab, monotonicFaces
+from .polkrawedzie import HalfEdges
+from .monotoniczne import Triangulate, triangulateMonotonic, triangulatePieces
+from .obserwator import Observer
+from .wsadowe import triangulateBatch
+from .pliki import readPolygons, batches, TriangleWriter, triangulateFile
+from .siatka import writeMesh, readMesh
+from .profilowanie import Report, profileTriangulation
+from .silniki import ENGINES, selectEngine, triangulatePolygon, earClipping
+from .delaunay import delaunayFlip
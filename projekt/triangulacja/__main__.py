@@ -0,0 +1,30 @@
+import sys
+from .geometria import getpoints
+from .monotoniczne import triangulateMonotonic
+from .pliki import triangulateFile
+from .sceny import SceneRecorder, makeResultScene
+from .wizualizacja import Plot
+# Tryb interaktywny: rysujemy wielokąt myszką ("Dodaj figurę"), po zamknięciu
+# okna wyświetlane są kolejne etapy podziału i triangulacji.
+# Tryb plikowy: python -m triangulacja WEJŚCIE WYJŚCIE - wielokąty z pliku WKT,
+# GeoJSON (w wierszach) albo CSV, trójkąty zapisywane strumieniowo jak w wyniki.txt.
+
+def main(argv=None):
+    argv=sys.argv[1:] if argv is None else argv
+    if len(argv)==2:
+        print("TRÓJKĄTÓW: ",triangulateFile(argv[0],argv[1]))
+        return
+    plot1 = Plot()
+    plot1.draw()
+    l=plot1.get_added_figure()
+    li=l[0].lines
+    pointSet=[tuple(p[0]) for p in li.tolist()]
+    pS,imin=getpoints(pointSet)
+    recorder=SceneRecorder()
+    triangles=triangulateMonotonic(pS,recorder)
+    recorder.scenes.append(makeResultScene(triangles))
+    plot=Plot(recorder.scenes)
+    plot.draw()
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,103 @@
+import json
+import struct
+import numpy as np
+from .wizualizacja import Scene, PointsCollection, LinesCollection
+# Binarne archiwum scen - szybsza alternatywa dla Plot.toJson / Plot(json=...).
+# Wszystkie punkty i odcinki wszystkich scen leżą w dwóch ciągłych tablicach
+# float64, a tablice przesunięć mówią, gdzie zaczyna się każda kolekcja i
+# które kolekcje należą do której sceny. Układ pliku (little-endian):
+#  nagłówek - b'SCEN', wersja, liczby: scen, kolekcji punktów, kolekcji odcinków,
+#             punktów, odcinków i bajtów opisu stylów
+#  int64  scenePoints (S+1), sceneLines (S+1) - zakresy kolekcji każdej sceny
+#  int64  pointOffsets (Cp+1), lineOffsets (Cl+1) - zakresy każdej kolekcji
+#  float64 points (P, 2), lines (L, 2, 2)
+#  int32  pointStyles (Cp), lineStyles (Cl) - numery stylów kolekcji
+#  JSON   lista różnych słowników kwargs (styli) kolekcji
+# loadScenes odwzorowuje plik w pamięci (memmap) i buduje scenę dopiero przy
+# odwołaniu scenes[i], więc otwarcie archiwum nie wczytuje wszystkich scen.
+MAGIC=b'SCEN'
+VERSION=1
+HEADER=struct.Struct('<4sIQQQQQQ')
+
+def saveScenes(path,scenes):
+    #zapis listy scen (albo sceny.DeltaScenes) do archiwum
+    styles={}
+    def style(kwargs):
+        key=json.dumps(kwargs,sort_keys=True)
+        return styles.setdefault(key,len(styles))
+    scenePoints,sceneLines=[0],[0]
+    pointSizes,lineSizes=[],[]
+    pointStyles,lineStyles=[],[]
+    points,lines=[],[]
+    for i in range(len(scenes)):
+        scene=scenes[i]
+        for collection in scene.points:
+            pts=np.asarray(collection.points,dtype=np.float64).reshape(-1,2)
+            points.append(pts)
+            pointSizes.append(len(pts))
+            pointStyles.append(style(collection.kwargs))
+        for collection in scene.lines:
+            segs=np.asarray(collection.lines,dtype=np.float64).reshape(-1,2,2)
+            lines.append(segs)
+            lineSizes.append(len(segs))
+            lineStyles.append(style(collection.kwargs))
+        scenePoints.append(len(pointSizes))
+        sceneLines.append(len(lineSizes))
+    meta=json.dumps([json.loads(key) for key in styles]).encode()
+    pointOffsets=np.concatenate([[0],np.cumsum(pointSizes,dtype=np.int64)])
+    lineOffsets=np.concatenate([[0],np.cumsum(lineSizes,dtype=np.int64)])
+    with open(path,'wb') as f:
+        f.write(HEADER.pack(MAGIC,VERSION,len(scenePoints)-1,len(pointSizes),len(lineSizes),int(pointOffsets[-1]),int(lineOffsets[-1]),len(meta)))
+        for array in (scenePoints,sceneLines,pointOffsets,lineOffsets):
+            f.write(np.asarray(array,dtype='<i8').data)
+        for array in points:
+            f.write(np.ascontiguousarray(array,dtype='<f8').data)
+        for array in lines:
+            f.write(np.ascontiguousarray(array,dtype='<f8').data)
+        f.write(np.asarray(pointStyles,dtype='<i4').data)
+        f.write(np.asarray(lineStyles,dtype='<i4').data)
+        f.write(meta)
+# Klasa SceneArchive to lista scen czytana z archiwum - jak sceny.DeltaScenes
+# może być przekazana do Plot, a scena jest budowana przy odwołaniu scenes[i].
+# Kolekcje dostają widoki tablic z pliku zamiast list krotek.
+class SceneArchive:
+    def __init__(self,path):
+        data=np.memmap(path,dtype=np.uint8,mode='r')
+        magic,version,s,cp,cl,p,l,m=HEADER.unpack(bytes(data[:HEADER.size]))
+        if magic!=MAGIC or version!=VERSION:
+            raise ValueError("to nie jest archiwum scen w wersji %d" % VERSION)
+        self.position=HEADER.size
+        def take(dtype,count,shape=()):
+            size=np.dtype(dtype).itemsize*count*int(np.prod(shape,dtype=np.int64))
+            array=data[self.position:self.position+size].view(dtype).reshape((count,)+shape)
+            self.position+=size
+            return array
+        self.scenePoints=take('<i8',s+1)
+        self.sceneLines=take('<i8',s+1)
+        self.pointOffsets=take('<i8',cp+1)
+        self.lineOffsets=take('<i8',cl+1)
+        self.points=take('<f8',p,(2,))
+        self.lines=take('<f8',l,(2,2))
+        self.pointStyles=take('<i4',cp)
+        self.lineStyles=take('<i4',cl)
+        self.styles=json.loads(bytes(data[self.position:self.position+m]))
+
+    def __len__(self):
+        return len(self.scenePoints)-1
+
+    def __getitem__(self,i):
+        if i<0:
+            i+=len(self)
+        if i<0 or i>=len(self):
+            raise IndexError(i)
+        points=[]
+        for c in range(self.scenePoints[i],self.scenePoints[i+1]):
+            pts=self.points[self.pointOffsets[c]:self.pointOffsets[c+1]]
+            points.append(PointsCollection(pts,**self.styles[self.pointStyles[c]]))
+        lines=[]
+        for c in range(self.sceneLines[i],self.sceneLines[i+1]):
+            segs=self.lines[self.lineOffsets[c]:self.lineOffsets[c+1]]
+            lines.append(LinesCollection(segs,**self.styles[self.lineStyles[c]]))
+        return Scene(points,lines)
+def loadScenes(path):
+    return SceneArchive(path)
@@ -0,0 +1,65 @@
+from collections import deque
+import numpy as np
+from .predykaty import incircle, orient
+from .wektorowe import orientations
+# Poprawa triangulacji wielokąta zamianami przekątnych (algorytm Lawsona).
+# Krawędź wewnętrzna wspólna dla trójkątów abc i bad jest niepoprawna, gdy d leży
+# wewnątrz okręgu opisanego na abc - wtedy zastępuje ją przekątna cd. Boki
+# wielokąta należą tylko do jednego trójkąta i nigdy nie są zamieniane, więc
+# wynikiem jest ograniczona (constrained) triangulacja Delaunaya wielokąta:
+# bez zmiany brzegu, z możliwie największym najmniejszym kątem.
+# Półkrawędź h=3t+k to bok trójkąta t od wierzchołka k do k+1, opp[h] to
+# półkrawędź przeciwna w sąsiednim trójkącie (-1 na brzegu). opp powstaje w
+# jednym przejściu ze słownikiem krawędzi, a kolejka trzyma krawędzie do
+# sprawdzenia - na początku wszystkie wewnętrzne, po zamianie cztery boki
+# powstałego czworokąta.
+
+def delaunayFlip(points,triangles):
+    #Zwraca (trójkąty int32 (m, 3) przeciwnie do ruchu wskazówek zegara, liczba
+    #zamian). points - lista punktów, tablica (n, 2) albo Polygon, triangles -
+    #trójki indeksów points (jak z Triangulate albo triangulatePolygon).
+    xy=np.asarray(points,dtype=np.float64).reshape(-1,2)
+    pts=[tuple(p) for p in xy.tolist()]
+    tri=np.array(triangles,dtype=np.int64).reshape(-1,3)
+    if len(tri)==0:
+        return tri.astype(np.int32),0
+    cw=orientations(xy,tri)<0
+    tri[cw]=tri[cw][:,::-1]
+    V=tri.ravel().tolist()
+    opp=[-1]*len(V)
+    edges={}
+    for h in range(len(V)):
+        a,b=V[h],V[h+1 if h%3<2 else h-2]
+        g=edges.pop((b,a),None)
+        if g is None:
+            edges[(a,b)]=h
+        else:
+            opp[h]=g
+            opp[g]=h
+    queue=deque(h for h in range(len(V)) if opp[h]>h)
+    flips=0
+    while queue:
+        h=queue.popleft()
+        g=opp[h]
+        if g<0:
+            continue
+        t,k=h-h%3,h%3
+        u,j=g-g%3,g%3
+        a,b,c=V[h],V[t+(k+1)%3],V[t+(k+2)%3]
+        d=V[u+(j+2)%3]
+        A,B,C,D=pts[a],pts[b],pts[c],pts[d]
+        if incircle(A,B,C,D)<=0 or orient(C,A,D)<=0 or orient(D,B,C)<=0:
+            continue
+        #abc, bad -> cad, dbc; boki czworokąta: ca, ad, db, bc
+        outer=(opp[t+(k+2)%3],opp[u+(j+1)%3],opp[u+(j+2)%3],opp[t+(k+1)%3])
+        V[t],V[t+1],V[t+2]=c,a,d
+        V[u],V[u+1],V[u+2]=d,b,c
+        for hh,oo in zip((t,t+1,u,u+1),outer):
+            opp[hh]=oo
+            if oo>=0:
+                opp[oo]=hh
+                queue.append(hh)
+        opp[t+2]=u+2
+        opp[u+2]=t+2
+        flips+=1
+    return np.array(V,dtype=np.int32).reshape(-1,3),flips
@@ -0,0 +1,93 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from .sceny import DeltaScenes
+from .wizualizacja import _Renderer
+# Eksport scen do plików graficznych bez okna (backend Agg) - np. w zadaniach
+# uruchamianych bez ekranu. Każda klatka rysowana jest na osobnej figurze
+# matplotlib.figure.Figure z płótnem FigureCanvasAgg (bez pyplot), tym samym
+# _Renderer co w oknie Plot. Klatki mogą być rysowane równolegle na executorze z
+# concurrent.futures (najlepiej ProcessPoolExecutor - rysowanie trzyma GIL), a
+# exportVideo składa je w GIF (Pillow) albo film (ffmpeg).
+PATTERN='klatka%05d.png'
+
+def _renderFrames(scenes,start,folder,pattern,size,dpi,limits):
+    #rysuje sceny do plików folder/pattern o numerach od start; scena z DeltaScenes
+    #jest odtwarzana dopiero tuż przed rysowaniem; rysuje tylko savefig
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    paths=[]
+    for k in range(len(scenes)):
+        figure=Figure(figsize=size,dpi=dpi)
+        FigureCanvasAgg(figure)
+        ax=figure.add_subplot()
+        _Renderer(ax).draw(scenes[k],[],[],limits is None,False,False)
+        if limits is not None:
+            ax.set_xlim(limits[0])
+            ax.set_ylim(limits[1])
+        path=os.path.join(folder,pattern % (start+k))
+        figure.savefig(path)
+        paths.append(path)
+    return paths
+def _part(scenes,a,b):
+    #sceny a..b-1 dla jednej paczki: z DeltaScenes i listy wycinek (dla DeltaScenes
+    #same przyrosty), z innych ciągów (np. archiwum.SceneArchive) gotowe sceny
+    if isinstance(scenes,(list,DeltaScenes)):
+        return scenes[a:b]
+    return [scenes[i] for i in range(a,b)]
+def exportFrames(scenes,folder,executor=None,pattern=PATTERN,size=(6.4,4.8),dpi=100,limits=None,chunks=None):
+    #Zapisuje sceny (lista albo sceny.DeltaScenes) jako obrazy folder/pattern i
+    #zwraca ich ścieżki. limits=((xmin, xmax), (ymin, ymax)) ustala zakres osi
+    #wszystkich klatek, domyślnie każda klatka jest autoskalowana. Executor dostaje
+    #przedziały numerów klatek razem z ich przyrostami z DeltaScenes, a pełne sceny
+    #powstają dopiero w procesach roboczych.
+    os.makedirs(folder,exist_ok=True)
+    if executor is None:
+        return _renderFrames(scenes,0,folder,pattern,size,dpi,limits)
+    if chunks is None:
+        chunks=4*(os.cpu_count() or 1)
+    step=max(1,-(-len(scenes)//chunks))
+    futures=[executor.submit(_renderFrames,_part(scenes,k,k+step),k,folder,pattern,size,dpi,limits) for k in range(0,len(scenes),step)]
+    return [path for future in futures for path in future.result()]
+def exportVideo(scenes,path,fps=5,executor=None,**options):
+    #Animacja scen: .gif składany przez Pillow, inne rozszerzenia (np. .mp4) przez ffmpeg
+    with tempfile.TemporaryDirectory() as folder:
+        frames=exportFrames(scenes,folder,executor,**options)
+        if path.lower().endswith('.gif'):
+            from PIL import Image
+            images=[Image.open(frame) for frame in frames]
+            images[0].save(path,save_all=True,append_images=images[1:],duration=int(1000/fps),loop=0)
+            for image in images:
+                image.close()
+        else:
+            if shutil.which('ffmpeg') is None:
+                raise RuntimeError("do zapisu filmu potrzebny jest program ffmpeg (albo plik .gif)")
+            pattern=os.path.join(folder,options.get('pattern',PATTERN))
+            subprocess.run(['ffmpeg','-y','-loglevel','error','-framerate',str(fps),'-i',pattern,'-pix_fmt','yuv420p',path],check=True)
+    return path
+
+def main(argv=None):
+    #python -m triangulacja.eksport WIELOKĄTY WYJŚCIE - animacja triangulacji
+    #pierwszego wielokąta z pliku (WKT, GeoJSON, CSV); WYJŚCIE to plik .gif/.mp4
+    #albo katalog na klatki
+    from concurrent.futures import ProcessPoolExecutor
+    from .geometria import getpoints
+    from .monotoniczne import triangulateMonotonic
+    from .pliki import readPolygons
+    from .sceny import SceneRecorder, makeResultScene
+    source,target=sys.argv[1:3] if argv is None else argv
+    pS,imin=getpoints([tuple(p) for p in next(readPolygons(source)).tolist()])
+    recorder=SceneRecorder()
+    triangles=triangulateMonotonic(pS,recorder)
+    recorder.scenes.append(makeResultScene(triangles))
+    with ProcessPoolExecutor() as executor:
+        if os.path.splitext(target)[1]:
+            exportVideo(recorder.scenes,target,executor=executor)
+        else:
+            exportFrames(recorder.scenes,target,executor)
+    print("KLATEK: ",len(recorder.scenes))
+
+if __name__=="__main__":
+    main()
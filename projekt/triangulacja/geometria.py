@@ -0,0 +1,177 @@
+# Podstawowe predykaty i przygotowanie wielokąta: wyznacznik, klasyfikacja
+# wierzchołków, uszeregowanie od najwyższego punktu i test monotoniczności.
+import numpy as np
+from .predykaty import orient
+from .wielokat import Polygon
+from .wektorowe import BEGIN, _monotone, levels, orientSigns, vertexTypes
+def Det(A,B,C):
+    # Funkcja określająca wzajemne położenie 3 kolejnych punktów
+    a=A[0]*B[1]
+    b=B[0]*C[1]
+    c=C[0]*A[1]
+    d=B[1]*C[0]
+    e=C[1]*A[0]
+    f=A[1]*B[0]
+    return a+b+c-(d+e+f)
+def classify(pointSet):
+    #wierzchołki początkowe, końcowe, dzielące, łączące i prawidłowe oraz krawędzie;
+    #wyznaczniki dla wszystkich trójek kolejnych wierzchołków liczone są naraz w vertexTypes
+    types=vertexTypes(pointSet).tolist()
+    types[0]=BEGIN
+    classified=([],[],[],[],[])
+    for p,t in zip(pointSet,types):
+        classified[t].append(p)
+    return classified+(edges(pointSet),)
+def edges(pointSet):
+    #krawędzie wielokąta, lines[i]=(pS[i],pS[i+1])
+    n=len(pointSet)
+    lines=[(pointSet[i-1],pointSet[i]) for i in range(1,n)]
+    lines.append((pointSet[n-1],pointSet[0]))
+    return lines
+def ycoords(pointSet):
+    #współrzędne y punktów jako tablica float64 - bez przepisywania całych punktów
+    if isinstance(pointSet,Polygon):
+        return pointSet.y
+    return np.fromiter((p[1] for p in pointSet),dtype=np.float64,count=len(pointSet))
+def heights(pointSet,direction=None):
+    #wysokości punktów - rzuty na wektor direction, domyślnie współrzędne y
+    if direction is None:
+        return ycoords(pointSet)
+    return np.asarray(pointSet,dtype=np.float64).reshape(-1,2)@np.asarray(direction,dtype=np.float64)
+def extremes(pointSet,direction=None):
+    #indeksy najwyżej i najniżej położonego punktu w porządku levels (przy równych
+    #wysokościach rozstrzyga x)
+    k=levels(pointSet,direction)
+    return int(np.argmax(k)),int(np.argmin(k))
+def orientation(pointSet):
+    #kierunek obiegu wielokąta: 1 - przeciwnie do ruchu wskazówek zegara, -1 - zgodnie.
+    #Odporny orient przy najniższym (potem najbardziej lewym) wierzchołku, który jest
+    #zawsze wypukły - znak sumy pól gubi się przy dużych współrzędnych (np. UTM)
+    pts=np.asarray(pointSet,dtype=np.float64).reshape(-1,2)
+    i=int(np.argmin(levels(pts)))
+    A,B,C=(tuple(pts[j].tolist()) for j in (i-1,i,(i+1)%len(pts)))
+    return -1 if orient(A,B,C)<0 else 1
+def counterclockwise(pS,imin):
+    #Wielokąt po getpoints obchodzony przeciwnie do ruchu wskazówek zegara (tego
+    #wymagają divide i Triangulate): trójka (pS, imin, flipped). Wielokąt zgodny z
+    #ruchem wskazówek jest odwracany z zachowaniem pS[0] - pS[0], pS[n-1], ..., pS[1],
+    #a wierzchołek i odwróconego to wierzchołek (-i) % n wyjściowego (flipped=True).
+    if orientation(pS)>0:
+        return pS,imin,False
+    n=len(pS)
+    reverse=(-np.arange(n))%n
+    if isinstance(pS,Polygon):
+        return pS.take(reverse),(-imin)%n,True
+    return [pS[i] for i in reverse.tolist()],(-imin)%n,True
+def getpoints(pointSet,direction=None):
+    #Funkcja zwraca punkty uszeregowane według wskazówek zegaraod leżącego najwyżej
+    #oraz indeks najniższego punktu w takim uszeregowaniu; direction - kierunek
+    #"w górę" (domyślnie oś y)
+    n=len(pointSet)
+    imax,imin=extremes(pointSet,direction)
+    imin=imin-imax if imax<imin else n-imax+imin
+    if isinstance(pointSet,Polygon):
+        return (pointSet.rotated(imax),imin)
+    return (pointSet[imax:]+pointSet[:imax],imin)
+def chainOrder(y,imax,imin):
+    #Wierzchołki wielokąta monotonicznego uszeregowane malejąco według y (albo
+    #kluczy levels - wtedy przy równych y według x) oraz
+    #przynależność do lewego łańcucha (1) lub prawego (0) - jako tablice indeksów
+    #do wielokąta, bez obracania go. Lewy łańcuch idzie od imax do imin-1, prawy
+    #od imax-1 wstecz do imin; oba są już posortowane, więc scalenie sprowadza się
+    #do policzenia dla każdego wierzchołka, ile wierzchołków drugiego łańcucha
+    #go poprzedza (przy równych kluczach pierwszeństwo ma prawy łańcuch).
+    y=np.asarray(y)
+    n=len(y)
+    k=imin-imax if imax<imin else n-imax+imin
+    left=np.arange(imax,imax+k)%n
+    right=np.arange(imax-1,imax-1-(n-k),-1)%n
+    ly,ry=-y[left],-y[right]
+    order=np.empty(n,dtype=np.int32)
+    order[np.arange(k)+np.searchsorted(ry,ly,side='right')]=left
+    order[np.arange(n-k)+np.searchsorted(ly,ry,side='left')]=right
+    isLeft=np.zeros(n,dtype=np.int8)
+    isLeft[left]=1
+    return order,isLeft
+def monotonic(lSet,imin,direction=None):
+    #czy wielokąt po getpoints(lSet, direction) jest monotoniczny względem direction
+    #w porządku levels - lewy łańcuch do imin nie rośnie, prawy nie maleje
+    k=levels(lSet,direction)
+    return bool(np.all(k[1:imin+1]<=k[:imin]) and np.all(k[imin+1:]>=k[imin:-1]))
+def monotoneDirection(pointSet):
+    #Kierunek (wektor jednostkowy), względem którego wielokąt jest monotoniczny
+    #w porządku levels (remisy wysokości rozstrzyga rzut prostopadły), albo None -
+    #najpierw oś y, potem _searchDirection.
+    if _monotone(levels(pointSet)):
+        return (0.0,1.0)
+    return _searchDirection(pointSet)
+def _searchDirection(pointSet):
+    #Kierunek monotoniczności inny niż oś y (sprawdzona już np. przez vertexScan)
+    #albo None. Najpierw sprawdzana jest oś x. Poza nią wierzchołek wklęsły v
+    #wyklucza kierunki, w których byłby ekstremum lokalnym (dzielącym albo
+    #łączącym) - łuk wokół dwusiecznej wektorów od sąsiadów do v o połowie
+    #szerokości (pi - kąt przy v)/2, modulo pi, bo kierunek i przeciwny są
+    #równoważne. Po posortowaniu końców łuków (O(n log n)) sprawdzam przez
+    #_monotone środek i ćwiartki kilku największych luk. Rzut na taki kierunek
+    #jest przybliżony, więc odrzucam kierunki prawie prostopadłe do którejś
+    #krawędzi - remis rozstrzygałby tam błąd zaokrąglenia, a nie levels.
+    pts=np.asarray(pointSet,dtype=np.float64).reshape(-1,2)
+    if _monotone(levels(pts,(1.0,0.0))):
+        return (1.0,0.0)
+    prev=np.roll(pts,1,axis=0)
+    nxt=np.roll(pts,-1,axis=0)
+    reflex=orientation(pts)*orientSigns(prev,pts,nxt)<0
+    a=pts[reflex]-prev[reflex]
+    b=pts[reflex]-nxt[reflex]
+    a/=np.hypot(a[:,0],a[:,1])[:,None]
+    b/=np.hypot(b[:,0],b[:,1])[:,None]
+    bisector=a+b
+    center=np.arctan2(bisector[:,1],bisector[:,0])
+    half=(np.pi-np.arccos(np.clip((a*b).sum(axis=1),-1,1)))/2
+    start=np.mod(center-half,np.pi)
+    end=start+2*half
+    wrap=end>np.pi
+    #wielokąt wypukły nie wyklucza żadnego kierunku - jedna luka długości pi
+    convex=int(not reflex.any())
+    starts=np.concatenate([start,np.zeros(np.count_nonzero(wrap)+convex)])
+    ends=np.concatenate([np.minimum(end,np.pi),end[wrap]-np.pi,np.zeros(convex)])
+    order=np.argsort(starts)
+    starts=starts[order]
+    ends=np.maximum.accumulate(ends[order])
+    gaps=np.append(starts[1:]-ends[:-1],starts[0]+np.pi-ends[-1])
+    steps=nxt-pts
+    lengths=np.hypot(steps[:,0],steps[:,1])
+    for k in np.argsort(-gaps)[:3].tolist():
+        if gaps[k]<=0:
+            break
+        for f in (0.5,0.25,0.75):
+            angle=float(ends[k]+gaps[k]*f)
+            direction=(float(np.cos(angle)),float(np.sin(angle)))
+            if np.all(np.abs(steps@np.array(direction))>1e-9*lengths) and _monotone(levels(pts,direction)):
+                return direction
+    return None
+def valid(pS,a,b,c,isLeft):
+    #sprawdzenie, czy trójkąt a b c (indeksy do pS) leży wewnątrz triangulowanrgo
+    #wielokąta monotonicznego; isLeft - czy a leży na lewym łańcuchu
+    d = orient(pS[a], pS[b], pS[c])
+    s=isLeft*2-1
+    return s*d<0
+def divide_classify(pS):
+    #klasyfikacja wierzchołków dla potrzeb funkcji divide - krotki (x,y,typ,indeks)
+    #posortowane malejąco po y, przy równych y po x, oraz krawędzie lines[i]=(pS[i],pS[i+1])
+    n=len(pS)
+    types=vertexTypes(pS)
+    types[0]=BEGIN#pS zaczyna się od najwyższego wierzchołka (getpoints)
+    types=types.tolist()
+    classified=[(pS[i][0],pS[i][1],types[i],i) for i in range(n)]
+    classified.sort(key=lambda x: (-x[1],-x[0]))
+    return classified,edges(pS)
+def divideEvents(pS,types=None):
+    #kolejność zdarzeń miotły (indeksy wierzchołków malejąco po y, przy równych
+    #y malejąco po x - porządek levels) oraz typy wierzchołków - obie jako tablice
+    #numpy; types - typy policzone już wcześniej (vertexScan), bez ponownej klasyfikacji
+    types=vertexTypes(pS) if types is None else np.array(types,dtype=np.int8)
+    types[0]=BEGIN#pS zaczyna się od najwyższego wierzchołka (getpoints)
+    pts=np.asarray(pS,dtype=np.float64).reshape(-1,2)
+    order=np.lexsort((-pts[:,0],-pts[:,1])).astype(np.int32)
+    return order,types
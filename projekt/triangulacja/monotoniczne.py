@@ -0,0 +1,187 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from .geometria import _searchDirection, chainOrder, counterclockwise, extremes, valid
+from .podzial import makeMonotonicTab, monotonicFaces
+from .wektorowe import levels, vertexScan
+from .wielokat import Polygon
+# Triangulacja wielokątów monotonicznych.
+def Triangulate(pS,imin,observer=None,imax=0,direction=None):
+    #Triangulacja wielokąta monotonicznego, zwraca trójki indeksów do pS.
+    #Domyślnie pS zaczyna się od najwyższego punktu (jak po getpoints), można też
+    #podać nieobrócony wielokąt razem z indeksem imax jego najwyższego punktu.
+    #direction - kierunek monotoniczności (domyślnie y), testy orientacji od niego
+    #nie zależą, zmienia się tylko kolejność wierzchołków (levels - remisy
+    #wysokości rozstrzyga rzut prostopadły).
+    order,isLeft=chainOrder(levels(pS,direction),imax,imin)
+    return _triangulateOrdered(pS,memoryview(order),isLeft.tobytes(),observer)
+def _triangulateOrdered(pS,vertices,isLeft,observer=None):
+    #Właściwa triangulacja - vertices to indeksy wierzchołków pS uszeregowane malejąco
+    #według y (jak z chainOrder), isLeft[i] mówi, czy wierzchołek i leży na lewym łańcuchu
+    n=len(vertices)
+    triangles=[]
+    #stos i bufor toput na zaalokowanych z góry listach - top i t to liczby
+    #elementów; bez blokad, które queue.LifoQueue bierze przy każdej operacji
+    stack=[None]*n
+    toput=[None]*n
+    stack[0]=vertices[0]
+    stack[1]=vertices[1]
+    top=2
+    for i in range(2,n):
+        A=vertices[i]
+        B=stack[top-1]
+        C=stack[top-2]
+        if observer is not None:
+            observer.stackStep(pS,A,top,isLeft[A]==isLeft[B] and i!=n-1)
+        top-=2
+        if (isLeft[A]!=isLeft[B] or i==n-1):
+            #Gdy wierzchołki są na różnych "gałęziach" wielokąta, lub wierzchołek jest najniższym w wielokącie
+            last=B
+            triangles.append((A,B,C))
+            if observer is not None:
+                observer.triangleAdded(pS,triangles)
+            while top>0:
+                B=C
+                top-=1
+                C=stack[top]
+                triangles.append((A,B,C))
+                if observer is not None:
+                    observer.triangleAdded(pS,triangles)
+            stack[0]=last
+            stack[1]=A
+            top=2
+        else:
+            t=0
+            while True:
+                if valid(pS,A,B,C,isLeft[A]):
+                    triangles.append((A,B,C))
+                    if observer is not None:
+                        observer.triangleAdded(pS,triangles)
+                else:
+                    toput[t]=B
+                    t+=1
+                if top>0:
+                    B=C
+                    top-=1
+                    C=stack[top]
+                else:
+                    break
+            stack[0]=C
+            top=1
+            for j in range(t-1,-1,-1):
+                stack[top]=toput[j]
+                top+=1
+            stack[top]=A
+            top+=1
+    return triangles
+def _triangulateFaces(xy,faces,offsets):
+    #triangulacja ścian faces[offsets[k]:offsets[k+1]] wielokąta o współrzędnych xy,
+    #zwraca tablicę int32 (m, 3) indeksów wierzchołków xy
+    triangles=[np.empty((0,3),dtype=np.int32)]
+    for k in range(len(offsets)-1):
+        face=faces[offsets[k]:offsets[k+1]]
+        m=Polygon(xy[face],face)
+        imax,imin=extremes(m)
+        local=np.array(Triangulate(m,imin,None,imax),dtype=np.intp).reshape(-1,3)
+        triangles.append(m.index[local])
+    return np.concatenate(triangles)
+def _triangulateShared(name,shape,faces,offsets):
+    #_triangulateFaces w procesie roboczym - współrzędne czytane wprost z pamięci
+    #współdzielonej, bez przesyłania ich do każdego procesu
+    #pamięć należy do procesu głównego (on ją zwalnia). Procesy robocze dzielą z nim
+    #resource_tracker, więc ich rejestracja niczego nie zmienia; od Pythona 3.13
+    #track=False całkiem ją pomija
+    try:
+        shm=shared_memory.SharedMemory(name=name,track=False)
+    except TypeError:
+        shm=shared_memory.SharedMemory(name=name)
+    xy=np.ndarray(shape,dtype=np.float64,buffer=shm.buf)
+    triangles=_triangulateFaces(xy,faces,offsets)
+    del xy
+    shm.close()
+    return triangles
+def triangulatePieces(pS,faces,executor=None,chunks=None):
+    #Triangulacja wielokątów monotonicznych podanych jako ściany (listy indeksów pS,
+    #jak z monotonicFaces). Z executorem z concurrent.futures ściany są dzielone na
+    #paczki o zbliżonej liczbie wierzchołków liczone równolegle; ProcessPoolExecutor
+    #dostaje współrzędne przez pamięć współdzieloną. Zwraca tablicę int32 (m, 3)
+    #indeksów wierzchołków pS w tej samej kolejności co wersja szeregowa.
+    xy=np.ascontiguousarray(pS,dtype=np.float64).reshape(-1,2)
+    sizes=np.fromiter((len(f) for f in faces),dtype=np.int64,count=len(faces))
+    offsets=np.zeros(len(faces)+1,dtype=np.int64)
+    np.cumsum(sizes,out=offsets[1:])
+    flat=np.fromiter((i for f in faces for i in f),dtype=np.int32,count=int(offsets[-1]))
+    if executor is None:
+        return _triangulateFaces(xy,flat,offsets)
+    if chunks is None:
+        chunks=4*(os.cpu_count() or 1)
+    #granice paczek - pierwsze ściany zaczynające się za kolejnymi częściami wierzchołków
+    bounds=np.unique(np.searchsorted(offsets,np.linspace(0,offsets[-1],chunks+1)))
+    bounds[-1]=len(faces)
+    shm=None
+    try:
+        if isinstance(executor,ProcessPoolExecutor):
+            shm=shared_memory.SharedMemory(create=True,size=max(xy.nbytes,1))
+            np.ndarray(xy.shape,dtype=np.float64,buffer=shm.buf)[:]=xy
+        futures=[]
+        for a,b in zip(bounds[:-1],bounds[1:]):
+            part=flat[offsets[a]:offsets[b]]
+            partOffsets=offsets[a:b+1]-offsets[a]
+            if shm is not None:
+                futures.append(executor.submit(_triangulateShared,shm.name,xy.shape,part,partOffsets))
+            else:
+                futures.append(executor.submit(_triangulateFaces,xy,part,partOffsets))
+        return np.concatenate([np.empty((0,3),dtype=np.int32)]+[f.result() for f in futures])
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+def triangulateMonotonic(pS,observer=None,executor=None,profile=False):
+    #Triangulacja dowolnego wielokąta prostego: podział na wielokąty monotoniczne
+    #i triangulacja każdego z nich. Zwraca listę trójkątów jako trójek punktów,
+    #a dla Polygon tablicę int32 (m, 3) numerów wierzchołków (Polygon.index).
+    #Z executorem wielokąty monotoniczne są triangulowane równolegle
+    #(triangulatePieces); obserwator wymaga kolejnych kroków, więc wtedy szeregowo.
+    #profile=True zwraca parę (trójkąty, profilowanie.Report) z czasami etapów
+    #i licznikami operacji - liczone szeregowo, więc razem z obserwatorem albo
+    #executorem to ValueError.
+    #Jedno przejście vertexScan daje typy wierzchołków, ekstrema i monotoniczność
+    #względem y: wielokąt y-monotoniczny trafia od razu do Triangulate, pozostałe
+    #najpierw do szukania innego kierunku (_searchDirection), a dopiero potem do
+    #divide z tymi samymi typami. Wielokąt zgodny z ruchem wskazówek zegara jest
+    #najpierw odwracany (counterclockwise); Polygon zachowuje przy tym numery wierzchołków.
+    if profile:
+        if observer is not None or executor is not None:
+            raise ValueError("profilowanie nie obsługuje obserwatora ani executora")
+        from .profilowanie import profileTriangulation
+        return profileTriangulation(pS)
+    pS=counterclockwise(pS,0)[0]
+    types,imax,imin,monotone=vertexScan(pS)
+    if monotone:
+        return _triangulateMonotonicTab(pS,[pS],observer,None,[(imax,imin)])
+    direction=_searchDirection(pS)
+    if direction is not None:
+        return _triangulateMonotonicTab(pS,[pS],observer,direction)
+    if executor is not None and observer is None:
+        triangles=triangulatePieces(pS,monotonicFaces(pS,types=types),executor)
+        if isinstance(pS,Polygon):
+            return pS.index[triangles]
+        return [(pS[a],pS[b],pS[c]) for a,b,c in triangles.tolist()]
+    return _triangulateMonotonicTab(pS,makeMonotonicTab(pS,observer,types),observer)
+def _triangulateMonotonicTab(pS,monotonic,observer=None,direction=None,ends=None):
+    #triangulacja kolejnych wielokątów monotonicznych z makeMonotonicTab(pS);
+    #ends - pary (imax, imin) wielokątów, jeśli już znane (vertexScan)
+    if ends is None:
+        ends=[extremes(m,direction) for m in monotonic]
+    if isinstance(pS,Polygon):
+        triangles=[np.empty((0,3),dtype=np.int32)]
+        for m,(imax,imin) in zip(monotonic,ends):
+            local=np.array(Triangulate(m,imin,observer,imax,direction),dtype=np.intp).reshape(-1,3)
+            triangles.append(m.index[local])
+        return np.concatenate(triangles)
+    triangles=[]
+    for m,(imax,imin) in zip(monotonic,ends):
+        for a,b,c in Triangulate(m,imin,observer,imax,direction):
+            triangles.append((m[a],m[b],m[c]))
+    return triangles
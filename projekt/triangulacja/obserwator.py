@@ -0,0 +1,22 @@
+# Klasa Observer opisuje zdarzenia, o których algorytmy powiadamiają w trakcie
+# działania - np. żeby zbudować sceny do prezentacji kolejnych kroków. Funkcje
+# podziału i triangulacji przyjmują observer=None i wtedy nie wywołują niczego
+# ani niczego nie kopiują, więc zwykłe wywołania zwracają jedynie wynik.
+class Observer:
+    # Wywoływana przed obsłużeniem przez miotłę wierzchołka v (krotka
+    # (x, y, typ, indeks) z divide_classify). Lista diagonals jest listą
+    # roboczą - obserwator musi ją skopiować, jeżeli chce ją zapamiętać.
+    def divideStep(self,pS,v,diagonals):
+        pass
+
+    # Wywoływana po dodaniu trójkąta w Triangulate. Trójkąty to trójki
+    # indeksów do pS, lista triangles jest listą roboczą.
+    def triangleAdded(self,pS,triangles):
+        pass
+
+    # Wywoływana w Triangulate przed obsłużeniem wierzchołka A, gdy na stosie
+    # jest size wierzchołków. sameChain mówi, czy A leży na tym samym łańcuchu co
+    # szczyt stosu (i nie jest ostatni) - wtedy zdejmowany jest cały stos i
+    # sprawdzana orientacja size-1 trójkątów.
+    def stackStep(self,pS,A,size,sameChain):
+        pass
@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+import re
+import numpy as np
+from .wsadowe import triangulateBatch
+# Strumieniowe wczytywanie wielokątów z plików i zapisywanie trójkątów. Czytniki
+# są generatorami zwracającymi po jednym wielokącie (tablica (n, 2) float64), a
+# TriangleWriter dopisuje trójkąty do pliku od razu, więc w pamięci jest naraz
+# tylko jedna paczka wielokątów. Obsługiwane formaty wejściowe:
+#  wkt     - w każdym wierszu POLYGON ((x y, x y, ...)); POLYGON EMPTY jest pomijany
+#  geojson - GeoJSON w wierszach (Feature albo sama geometria Polygon/MultiPolygon)
+#  csv     - wiersze id,x,y; kolejne wiersze o tym samym id tworzą wielokąt
+# Wielokąty z dziurami nie są obsługiwane (triangulacja dotyczy wielokątów prostych).
+FORMATS={'.wkt':'wkt','.geojsonl':'geojson','.geojsons':'geojson','.jsonl':'geojson','.ndjson':'geojson','.csv':'csv'}
+
+def _ring(points):
+    #pierścień jako tablica (n, 2), bez powtórzonego na końcu pierwszego punktu
+    pts=np.asarray(points,dtype=np.float64).reshape(-1,2)
+    if len(pts)>1 and (pts[0]==pts[-1]).all():
+        pts=pts[:-1]
+    return pts
+def _rings(rings):
+    if len(rings)!=1:
+        raise ValueError("wielokąty z dziurami nie są obsługiwane")
+    return _ring(rings[0])
+#granica między pierścieniami WKT - "), (" z dowolnymi odstępami
+_RINGS=re.compile(r'\)\s*,\s*\(')
+def readWKT(lines):
+    for line in lines:
+        line=line.strip()
+        if not line:
+            continue
+        kind,body=re.match(r'(\w*)\s*(.*)',line).groups()
+        if kind.upper()!='POLYGON':
+            raise ValueError("nieobsługiwana geometria WKT: "+kind)
+        if body.upper()=='EMPTY':
+            continue
+        if not body.startswith('(') or not body.endswith(')'):
+            raise ValueError("niepoprawny wielokąt WKT: "+line)
+        rings=_RINGS.split(body[1:-1])
+        yield _rings([np.array(r.strip(' ()').replace(',',' ').split(),dtype=np.float64) for r in rings])
+def readGeoJSON(lines):
+    for line in lines:
+        if not line.strip():
+            continue
+        geometry=json.loads(line)
+        if geometry.get('type')=='Feature':
+            geometry=geometry['geometry']
+        if geometry['type']=='Polygon':
+            yield _rings(geometry['coordinates'])
+        elif geometry['type']=='MultiPolygon':
+            for polygon in geometry['coordinates']:
+                yield _rings(polygon)
+        else:
+            raise ValueError("nieobsługiwana geometria GeoJSON: "+geometry['type'])
+def readCSV(lines):
+    current=None
+    points=[]
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        try:
+            x,y=float(row[1]),float(row[2])
+        except ValueError:
+            continue#nagłówek
+        if row[0]!=current and points:
+            yield _ring(points)
+            points=[]
+        current=row[0]
+        points.append((x,y))
+    if points:
+        yield _ring(points)
+READERS={'wkt':readWKT,'geojson':readGeoJSON,'csv':readCSV}
+
+def readPolygons(path,format=None):
+    #kolejne wielokąty z pliku; format wynika z rozszerzenia, jeśli nie jest podany
+    if format is None:
+        format=FORMATS[os.path.splitext(path)[1].lower()]
+    with open(path,newline='') as f:
+        yield from READERS[format](f)
+def batches(polygons,size=10000):
+    #grupuje wielokąty w paczki (coords, offsets) dla triangulateBatch, po
+    #najwyżej size wierzchołków (wielokąt większy od size tworzy własną paczkę)
+    chunk=[]
+    count=0
+    for polygon in polygons:
+        if chunk and count+len(polygon)>size:
+            yield _batch(chunk)
+            chunk=[]
+            count=0
+        chunk.append(polygon)
+        count+=len(polygon)
+    if chunk:
+        yield _batch(chunk)
+def _batch(chunk):
+    offsets=np.zeros(len(chunk)+1,dtype=np.int64)
+    np.cumsum([len(p) for p in chunk],out=offsets[1:])
+    return np.concatenate(chunk),offsets
+# Klasa TriangleWriter dopisuje trójkąty do pliku tekstowego. Format txt to ten
+# sam co w lab3/wyniki.txt (trzy punkty (x, y) rozdzielone tabulatorami), a wkt
+# zapisuje każdy trójkąt jako POLYGON.
+class TriangleWriter:
+    def __init__(self,path,format='txt'):
+        self.file=open(path,'w')
+        self.format=format
+        self.count=0
+
+    # Metoda zapisuje trójkąty podane jako trójki indeksów do coords.
+    def write(self,coords,triangles):
+        corners=np.asarray(coords,dtype=np.float64)[np.asarray(triangles,dtype=np.intp).reshape(-1,3)].tolist()
+        if self.format=='wkt':
+            lines=["POLYGON ((%r %r, %r %r, %r %r, %r %r))\n" % (a[0],a[1],b[0],b[1],c[0],c[1],a[0],a[1]) for a,b,c in corners]
+        else:
+            lines=["(%r, %r)\t(%r, %r)\t(%r, %r)\n" % (a[0],a[1],b[0],b[1],c[0],c[1]) for a,b,c in corners]
+        self.file.writelines(lines)
+        self.count+=len(corners)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args):
+        self.close()
+def triangulateFile(source,target,format=None,output='txt',size=10000,executor=None):
+    #Triangulacja wszystkich wielokątów z pliku source z zapisem do target, paczkami
+    #po size wierzchołków; zwraca liczbę zapisanych trójkątów
+    with TriangleWriter(target,output) as writer:
+        for coords,offsets in batches(readPolygons(source,format),size):
+            triangles,toffsets=triangulateBatch(coords,offsets,executor)
+            writer.write(coords,triangles)
+    return writer.count
@@ -0,0 +1,81 @@
+from .geometria import divideEvents
+from .polkrawedzie import HalfEdges
+from .struktury import StatusTree
+from .wektorowe import BEGIN, END, DIVIDE, MERGE, DEFAULT
+from .wielokat import subPolygon
+# Podział wielokąta na wielokąty monotoniczne metodą zamiatania.
+def divide(pS,statestruct=None,observer=None,types=None):
+    #Zwraca przekątne (pary indeksów wierzchołków) dzielące pS na wielokąty
+    #monotoniczne. Krawędź i to odcinek pS[i] - pS[i+1], pomocnik krawędzi w
+    #strukturze stanu to indeks wierzchołka. pS musi być wielokątem prostym
+    #obchodzonym przeciwnie do ruchu wskazówek zegara, od najwyższego wierzchołka
+    #(geometria.counterclockwise po getpoints) - inaczej ValueError. types - typy
+    #wierzchołków z vertexScan, jeśli już są policzone.
+    n=len(pS)
+    order,types=divideEvents(pS,types)
+    #bez przepisywania tablic do list: bytes i memoryview zwracają zwykłe inty
+    types=types.tobytes()
+    diagonals=[]
+    if statestruct is None:
+        statestruct=StatusTree(pS)
+    try:
+        for i in memoryview(order):#kolejne wierzchołki od najwyższego
+            t=types[i]
+            if observer is not None:
+                observer.divideStep(pS,pS[i]+(t,i),diagonals)
+            if t==BEGIN:
+                #początkowy
+                statestruct[i]=i
+            elif t==END:
+                #końcowy
+                el=(i-1)%n
+                helper=statestruct.get(el)
+                if types[helper]==MERGE:
+                    diagonals.append((i,helper))
+                statestruct.pop(el)
+            elif t==DIVIDE:
+                #dzielący
+                ev=statestruct.find_left(pS[i])
+                helper=statestruct.get(ev)
+                diagonals.append((i,helper))
+                statestruct[ev]=i
+                statestruct[i]=i
+            elif t==MERGE:
+                #łączący
+                ep=(i-1)%n
+                helper=statestruct.get(ep)
+                if types[helper]==MERGE:
+                    diagonals.append((i,helper))
+                statestruct.pop(ep)
+                ev=statestruct.find_left(pS[i])
+                helper=statestruct.get(ev)
+                if types[helper]==MERGE:
+                    diagonals.append((i,helper))
+                statestruct[ev]=i
+            elif t==DEFAULT:
+                #prawidłowy
+                eg=(i-1)%n
+                if eg in statestruct:
+                    helper=statestruct.get(eg)
+                    if types[helper]==MERGE:
+                        diagonals.append((i,helper))
+                    statestruct.pop(eg)
+                    statestruct[i]=i
+                else:
+                    ev=statestruct.find_left(pS[i])
+                    helper=statestruct.get(ev)
+                    if types[helper]==MERGE:
+                        diagonals.append((i,helper))
+                    statestruct[ev]=i
+    except (TypeError,KeyError):
+        #brak krawędzi na lewo od wierzchołka albo usuwanej krawędzi w strukturze stanu
+        raise ValueError("wielokąt nie jest prosty albo jest zgodny z ruchem wskazówek zegara") from None
+    return diagonals
+def monotonicFaces(pS,observer=None,types=None):
+    #Wielokąty monotoniczne jako listy indeksów wierzchołków pS - ściany podziału
+    #wielokąta przekątnymi z divide, bez kopiowania punktów
+    return HalfEdges(pS,divide(pS,observer=observer,types=types)).faces()
+def makeMonotonicTab(pS,observer=None,types=None):
+    #Dzielę wielokąt na wielokąty monotoniczne, wykorzystując jego podział przekątnymi;
+    #zwracam listę wielokątów (list punktów albo Polygon) w kolejności ścian
+    return [subPolygon(pS,face) for face in monotonicFaces(pS,observer,types)]
@@ -0,0 +1,58 @@
+import math
+# Struktura półkrawędziowa (DCEL) wielokąta podzielonego przekątnymi. Półkrawędź
+# i < n to bok pS[i] -> pS[i+1], a przekątna k daje dwie półkrawędzie: n+2k (a -> b)
+# i n+2k+1 (b -> a). Wielokąt jest zorientowany przeciwnie do ruchu wskazówek
+# zegara, więc wnętrze ściany leży zawsze po lewej stronie półkrawędzi, a ściany
+# obchodzone przez next też są przeciwnie do ruchu wskazówek zegara.
+class HalfEdges:
+    def __init__(self,pS,diagonals):
+        n=len(pS)
+        self.n=n
+        self.origin=list(range(n))
+        self.next=list(range(1,n))+[0]#bez przekątnych po boku v-1 -> v idzie bok v -> v+1
+        out={}#wierzchołek -> wychodzące z niego półkrawędzie przekątnych
+        for a,b in set((min(a,b),max(a,b)) for a,b in diagonals):
+            if (b-a)%n in (1,n-1):
+                continue#"przekątna" pokrywająca się z bokiem nie dzieli wielokąta
+            h=len(self.origin)
+            self.origin+=[a,b]
+            self.next+=[None,None]
+            out.setdefault(a,[]).append(h)
+            out.setdefault(b,[]).append(h+1)
+        for v,hs in out.items():
+            #półkrawędzie wychodzące z v uszeregowane zgodnie z ruchem wskazówek zegara
+            #od kierunku v -> v-1; ostatni jest bok v -> v+1
+            x,y=pS[v][0],pS[v][1]
+            u=pS[(v-1)%n]
+            ref=math.atan2(u[1]-y,u[0]-x)
+            angles=[]
+            for h in hs:
+                t=pS[self.origin[self.twin(h)]]
+                angles.append(((ref-math.atan2(t[1]-y,t[0]-x))%(2*math.pi),h))
+            ordered=[h for a,h in sorted(angles)]+[v]
+            #ściana na lewo od półkrawędzi wchodzącej do v ciągnie się pierwszą
+            #półkrawędzią wychodzącą na prawo od niej
+            self.next[(v-1)%n]=ordered[0]
+            for k in range(len(ordered)-1):
+                self.next[self.twin(ordered[k])]=ordered[k+1]
+
+    def twin(self,h):
+        #bliźniacza półkrawędź przekątnej (boki wielokąta nie mają bliźniaków)
+        return self.n+((h-self.n)^1)
+
+    def faces(self):
+        #ściany podziału jako listy indeksów wierzchołków pS; każda półkrawędź
+        #jest odwiedzana raz, więc całość kosztuje O(n+d)
+        visited=[False]*len(self.next)
+        faces=[]
+        for start in range(len(self.next)):
+            if visited[start]:
+                continue
+            face=[]
+            h=start
+            while not visited[h]:
+                visited[h]=True
+                face.append(self.origin[h])
+                h=self.next[h]
+            faces.append(face)
+        return faces
@@ -0,0 +1,83 @@
+from fractions import Fraction
+# Odporny test orientacji trzech punktów (wg J. R. Shewchuka, "Adaptive
+# Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates").
+# Najpierw liczymy wyznacznik w zwykłej arytmetyce zmiennoprzecinkowej i
+# sprawdzamy, czy jego wartość jest większa od oszacowania błędu zaokrągleń -
+# wtedy znak jest na pewno poprawny. Tylko gdy nie jest, liczymy dokładnie na
+# ułamkach (każdy float jest liczbą wymierną). Dla typowych danych prawie
+# wszystkie wywołania kończą się na szybkiej ścieżce.
+
+EPSILON=2.0**(-53)
+CCW_ERRBOUND=(3.0+16.0*EPSILON)*EPSILON
+
+def orientFast(A,B,C):
+    #znak Det(A,B,C) (-1, 0, 1) albo None, jeżeli błąd zaokrągleń może go zmienić
+    detleft=(A[0]-C[0])*(B[1]-C[1])
+    detright=(A[1]-C[1])*(B[0]-C[0])
+    det=detleft-detright
+    if detleft>0:
+        if detright<=0:
+            return 1
+        detsum=detleft+detright
+    elif detleft<0:
+        if detright>=0:
+            return -1
+        detsum=-detleft-detright
+    else:
+        return (det>0)-(det<0)
+    if det>=CCW_ERRBOUND*detsum:
+        return 1
+    if -det>=CCW_ERRBOUND*detsum:
+        return -1
+    return None
+def orientExact(A,B,C):
+    #dokładny znak Det(A,B,C) w arytmetyce wymiernej
+    ax,ay=Fraction(A[0]),Fraction(A[1])
+    bx,by=Fraction(B[0]),Fraction(B[1])
+    cx,cy=Fraction(C[0]),Fraction(C[1])
+    det=(ax-cx)*(by-cy)-(ay-cy)*(bx-cx)
+    return (det>0)-(det<0)
+def orient(A,B,C):
+    #znak Det(A,B,C): 1 - C leży na lewo od prostej AB, -1 - na prawo, 0 - współliniowe
+    s=orientFast(A,B,C)
+    if s is None:
+        s=orientExact(A,B,C)
+    return s
+# Test okręgu opisanego w ten sam sposób: oszacowanie błędu wg Shewchuka dla
+# wyznacznika 3x3 z podniesieniem na paraboloidę, dokładnie na ułamkach tylko
+# w przypadkach niepewnych.
+ICC_ERRBOUND=(10.0+96.0*EPSILON)*EPSILON
+
+def incircleFast(A,B,C,D):
+    #znak testu okręgu albo None, jeżeli błąd zaokrągleń może go zmienić
+    adx,ady=A[0]-D[0],A[1]-D[1]
+    bdx,bdy=B[0]-D[0],B[1]-D[1]
+    cdx,cdy=C[0]-D[0],C[1]-D[1]
+    bdxcdy,cdxbdy=bdx*cdy,cdx*bdy
+    cdxady,adxcdy=cdx*ady,adx*cdy
+    adxbdy,bdxady=adx*bdy,bdx*ady
+    alift=adx*adx+ady*ady
+    blift=bdx*bdx+bdy*bdy
+    clift=cdx*cdx+cdy*cdy
+    det=alift*(bdxcdy-cdxbdy)+blift*(cdxady-adxcdy)+clift*(adxbdy-bdxady)
+    permanent=(abs(bdxcdy)+abs(cdxbdy))*alift+(abs(cdxady)+abs(adxcdy))*blift+(abs(adxbdy)+abs(bdxady))*clift
+    errbound=ICC_ERRBOUND*permanent
+    if det>errbound:
+        return 1
+    if -det>errbound:
+        return -1
+    return None
+def incircleExact(A,B,C,D):
+    #dokładny znak testu okręgu w arytmetyce wymiernej
+    adx,ady=Fraction(A[0])-Fraction(D[0]),Fraction(A[1])-Fraction(D[1])
+    bdx,bdy=Fraction(B[0])-Fraction(D[0]),Fraction(B[1])-Fraction(D[1])
+    cdx,cdy=Fraction(C[0])-Fraction(D[0]),Fraction(C[1])-Fraction(D[1])
+    det=(adx*adx+ady*ady)*(bdx*cdy-cdx*bdy)+(bdx*bdx+bdy*bdy)*(cdx*ady-adx*cdy)+(cdx*cdx+cdy*cdy)*(adx*bdy-bdx*ady)
+    return (det>0)-(det<0)
+def incircle(A,B,C,D):
+    #1 - D leży wewnątrz okręgu opisanego na trójkącie ABC (przeciwnie do ruchu
+    #wskazówek zegara), -1 - na zewnątrz, 0 - na okręgu
+    s=incircleFast(A,B,C,D)
+    if s is None:
+        s=incircleExact(A,B,C,D)
+    return s
@@ -0,0 +1,136 @@
+import time
+from .geometria import _searchDirection, counterclockwise, getpoints
+from .monotoniczne import _triangulateMonotonicTab
+from .obserwator import Observer
+from .podzial import divide
+from .polkrawedzie import HalfEdges
+from .struktury import StatusTree, rightOf
+from .wektorowe import vertexScan
+from .wielokat import subPolygon
+# Profilowanie triangulacji: czasy kolejnych etapów (time.perf_counter_ns) i
+# liczniki operacji. Zwykłe wywołania nic tu nie liczą - liczniki zbierane są
+# w osobnym przebiegu przez CountingStatus (struktura stanu dla divide) i
+# obserwatora _StackCounter, więc nie zawyżają też zmierzonych czasów.
+STAGES=('getpoints','classify','divide','makeMonotonicTab','Triangulate')
+COUNTERS=('orientTests','statusLookups','statusInserts','statusRemovals','stackPushes','stackPops','diagonals','monotonePolygons','triangles')
+
+# Klasa Report to wynik profilowania: times - czasy etapów w nanosekundach,
+# counters - liczniki operacji (w kolejności STAGES i COUNTERS). Czasy pochodzą
+# z mierzonego przebiegu, liczniki z drugiego, liczącego (divide i Triangulate
+# wykonywane jeszcze raz) - są odtworzone, a nie zebrane w trakcie pomiaru.
+# stackPushes nie jest liczone bezpośrednio, tylko wyliczane ze stackPops
+# (zob. _StackCounter).
+class Report:
+    def __init__(self):
+        self.times=dict.fromkeys(STAGES,0)
+        self.counters=dict.fromkeys(COUNTERS,0)
+
+    def total(self):
+        return sum(self.times.values())
+
+    def asdict(self):
+        return {'times':dict(self.times),'counters':dict(self.counters)}
+
+    def __str__(self):
+        total=self.total() or 1
+        lines=["%-18s %12s %7s" % ("etap","czas [ms]","udział")]
+        for stage,t in self.times.items():
+            lines.append("%-18s %12.3f %6.1f%%" % (stage,t/10**6,100*t/total))
+        lines.append("%-18s %12.3f" % ("razem",self.total()/10**6))
+        for name,count in self.counters.items():
+            lines.append("%-18s %12d" % (name,count))
+        return "\n".join(lines)
+# StatusTree liczący wyszukiwania (get, in, find_left), wstawienia i usunięcia
+# krawędzi oraz testy położenia punktu względem krawędzi w find_left.
+class CountingStatus(StatusTree):
+    def __init__(self,pS,counters):
+        super().__init__(pS)
+        self.counters=counters
+
+    def __contains__(self,edge):
+        self.counters['statusLookups']+=1
+        return super().__contains__(edge)
+
+    def get(self,edge):
+        self.counters['statusLookups']+=1
+        return super().get(edge)
+
+    def __setitem__(self,edge,helper):
+        if edge not in self.helpers:
+            self.counters['statusInserts']+=1
+        super().__setitem__(edge,helper)
+
+    def pop(self,edge):
+        self.counters['statusRemovals']+=1
+        return super().pop(edge)
+
+    def find_left(self,point):
+        self.counters['statusLookups']+=1
+        node=self.root
+        cur_left=None
+        while node is not None:
+            self.counters['orientTests']+=1
+            if rightOf(node.segment,point):
+                cur_left=node.edge
+                node=node.right
+            else:
+                node=node.left
+        return cur_left
+# Obserwator liczący zdjęcia ze stosu i testy orientacji w Triangulate. Każdy
+# krok zdejmuje cały stos; wkładane są z powrotem wierzchołki, które zostają,
+# więc wstawień jest o 2 na wielokąt (dwa pierwsze wierzchołki) więcej niż zdjęć.
+class _StackCounter(Observer):
+    def __init__(self,counters):
+        self.counters=counters
+
+    def stackStep(self,pS,A,size,sameChain):
+        self.counters['stackPops']+=size
+        if sameChain:
+            self.counters['orientTests']+=size-1
+
+def profileTriangulation(pS,counters=True):
+    #Triangulacja jak triangulateMonotonic (pS w dowolnym obrocie) z pomiarem
+    #czasów etapów; zwraca parę (trójkąty, Report). Etap classify to vertexScan
+    #(typy wierzchołków, ekstrema, monotoniczność względem y) i ewentualnie szukanie
+    #innego kierunku - gdy wielokąt jest monotoniczny, idzie od razu do Triangulate,
+    #a etapy divide i makeMonotonicTab mają czas 0. W przeciwnym razie divide
+    #dostaje gotowe typy, więc jego czas nie obejmuje klasyfikacji.
+    #counters=False pomija drugi, liczący przebieg.
+    report=Report()
+    times=report.times
+    count=report.counters
+    clock=time.perf_counter_ns
+    start=clock()
+    pS,imin=getpoints(pS)
+    pS=counterclockwise(pS,imin)[0]
+    times['getpoints']=clock()-start
+    start=clock()
+    types,imax,imin,monotone=vertexScan(pS)
+    direction=None if monotone else _searchDirection(pS)
+    sweep=not monotone and direction is None
+    times['classify']=clock()-start
+    if not sweep:
+        monotonic=[pS]
+        start=clock()
+        triangles=_triangulateMonotonicTab(pS,monotonic,None,direction,[(imax,imin)] if monotone else None)
+        times['Triangulate']=clock()-start
+    else:
+        start=clock()
+        diagonals=divide(pS,types=types)
+        times['divide']=clock()-start
+        start=clock()
+        monotonic=[subPolygon(pS,face) for face in HalfEdges(pS,diagonals).faces()]
+        times['makeMonotonicTab']=clock()-start
+        start=clock()
+        triangles=_triangulateMonotonicTab(pS,monotonic)
+        times['Triangulate']=clock()-start
+        count['diagonals']=len(diagonals)
+    count['monotonePolygons']=len(monotonic)
+    count['triangles']=len(triangles)
+    if counters:
+        if sweep:
+            count['orientTests']+=len(pS)#klasyfikacja - wyznacznik dla każdego wierzchołka
+            divide(pS,CountingStatus(pS,count),types=types)
+        _triangulateMonotonicTab(pS,monotonic,_StackCounter(count),direction)
+        count['stackPushes']=count['stackPops']+2*len(monotonic)
+    return triangles,report
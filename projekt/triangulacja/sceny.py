@@ -0,0 +1,130 @@
+from .geometria import classify
+from .monotoniczne import Triangulate
+from .obserwator import Observer
+from .wizualizacja import Scene, PointsCollection, LinesCollection, Plot
+# Funkcje budujące sceny do prezentacji kolejnych etapów algorytmów.
+def classifyShow(pointSet):
+    begin,end,divide,merge,default,lines=classify(pointSet)
+    return Scene([PointsCollection(begin,color='green'),PointsCollection(end,color='red'),PointsCollection(merge,color='purple'),PointsCollection(divide,color='blue'),PointsCollection(default,color='grey')],[LinesCollection(lines,color='grey')])
+def makeTriangulateScene(triangles,pS):
+    lines1=set()
+    lines2=[]
+    for triangle in triangles:
+        lines1.add((triangle[0],triangle[1]))
+        lines1.add((triangle[1],triangle[2]))
+        lines1.add((triangle[0],triangle[2]))
+    n=len(pS)
+    for i in range(n):
+        if not( (pS[i-1],pS[i]) in lines1) and (not(pS[i],pS[i-1]) in lines1):
+            lines2.append((pS[i-1],pS[i]))
+    return Scene([PointsCollection(pS)],[LinesCollection(list(lines1),color='blue'),LinesCollection(lines2,color='grey')])
+def makeDivideScene(diagonals,v,pS):
+    y=v[1]
+    broom=((0,y),(1,y))
+    lines=[]
+    diags=[]
+    for d in diagonals:
+        diags.append((pS[d[0]],pS[d[1]]))
+    n=len(pS)
+    for i in range(n):
+        lines.append((pS[i-1],pS[i]))
+    return Scene([PointsCollection(pS)],[LinesCollection([broom],color='black'),LinesCollection(lines,color='grey'),LinesCollection(diags,color='red')])
+def makeResultScene(triangles):
+    #scena z gotową triangulacją (trójkąty jako trójki punktów)
+    p=[]
+    l=[]
+    for triangle in triangles:
+        p.append(triangle[0])
+        p.append(triangle[1])
+        p.append(triangle[2])
+        l.append([triangle[0],triangle[1]])
+        l.append([triangle[2],triangle[1]])
+        l.append([triangle[0],triangle[2]])
+    return Scene([PointsCollection(p,color='blue')],[LinesCollection(l,color='blue')])
+# Klasa _Track przechowuje kolejne elementy (przekątne albo trójkąty) dodawane
+# przez jeden przebieg algorytmu na jednym wielokącie pS.
+class _Track:
+    __slots__=('kind','pS','items')
+    def __init__(self,kind,pS):
+        self.kind=kind
+        self.pS=pS
+        self.items=[]
+# Klasa DeltaScenes jest listą scen, która zamiast pełnych scen pamięta dla
+# każdego kroku jedynie przyrost: ścieżkę (_Track), liczbę jej elementów
+# widocznych w tym kroku i położenie miotły. Pamięć rośnie więc liniowo z
+# liczbą kroków, a konkretna scena jest odtwarzana dopiero przy odwołaniu
+# scenes[i] (czyli przy rysowaniu po naciśnięciu "Następny"/"Poprzedni").
+# Można do niej dopisywać także gotowe sceny metodą append. Wycinek scenes[a:b]
+# to znów DeltaScenes - same przyrosty, np. do wysłania procesowi roboczemu.
+class DeltaScenes:
+    def __init__(self):
+        self.frames=[]
+        self.cached=(None,None)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self,i):
+        if isinstance(i,slice):
+            result=DeltaScenes()
+            result.frames=self.frames[i]
+            return result
+        if i<0:
+            i+=len(self.frames)
+        if i<0 or i>=len(self.frames):
+            raise IndexError(i)
+        if self.cached[0]!=i:
+            self.cached=(i,self.build(self.frames[i]))
+        return self.cached[1]
+
+    def __add__(self,scenes):
+        result=DeltaScenes()
+        result.frames=self.frames+list(scenes)
+        return result
+
+    def __radd__(self,scenes):
+        result=DeltaScenes()
+        result.frames=list(scenes)+self.frames
+        return result
+
+    def append(self,scene):
+        self.frames.append(scene)
+
+    def addFrame(self,track,count,v=None):
+        self.frames.append((track,count,v))
+
+    def build(self,frame):
+        if isinstance(frame,Scene):
+            return frame
+        track,count,v=frame
+        pS=track.pS
+        if track.kind=='divide':
+            return makeDivideScene(track.items[:count],v,pS)
+        return makeTriangulateScene([(pS[a],pS[b],pS[c]) for a,b,c in track.items[:count]],pS)
+# Klasa SceneRecorder jest obserwatorem, który po każdym kroku miotły i po
+# każdym nowym trójkącie dopisuje klatkę do scenes (DeltaScenes). Z list
+# roboczych algorytmu kopiowane są tylko elementy dodane od poprzedniego kroku.
+class SceneRecorder(Observer):
+    def __init__(self):
+        self.scenes=DeltaScenes()
+        self.track=None
+        self.source=None
+
+    def record(self,kind,pS,items,v=None):
+        if self.track is None or self.source is not items or self.track.kind!=kind or len(items)<len(self.track.items):
+            self.track=_Track(kind,pS)
+            self.source=items
+        self.track.items.extend(items[len(self.track.items):])
+        self.scenes.addFrame(self.track,len(self.track.items),v)
+
+    def divideStep(self,pS,v,diagonals):
+        self.record('divide',pS,diagonals,v)
+
+    def triangleAdded(self,pS,triangles):
+        self.record('triangulate',pS,triangles)
+def TriangulateWhileDrawing(pS,imin):
+    recorder=SceneRecorder()
+    recorder.triangleAdded(pS,[])
+    Triangulate(pS,imin,recorder)
+    plot=Plot(recorder.scenes)
+    plot.draw()
@@ -0,0 +1,29 @@
+import struct
+import numpy as np
+# Binarny zapis siatki trójkątów. Plik składa się z nagłówka i dwóch tablic
+# zapisanych wprost z pamięci (little-endian):
+#  nagłówek  - b'TRIM', wersja (uint32), liczba wierzchołków i trójkątów (2 x uint64)
+#  wierzchołki - float64 (n, 2)
+#  trójkąty    - int32 (m, 3), indeksy wierzchołków (jak z Triangulate)
+# Każdy wierzchołek jest zapisany raz, a readMesh zwraca tablice numpy.memmap,
+# więc odczyt nie kopiuje danych - strony pliku są wczytywane przy dostępie.
+MAGIC=b'TRIM'
+VERSION=1
+HEADER=struct.Struct('<4sIQQ')
+
+def writeMesh(path,coords,triangles):
+    vertices=np.ascontiguousarray(coords,dtype='<f8').reshape(-1,2)
+    triangles=np.ascontiguousarray(triangles,dtype='<i4').reshape(-1,3)
+    with open(path,'wb') as f:
+        f.write(HEADER.pack(MAGIC,VERSION,len(vertices),len(triangles)))
+        f.write(vertices.data)
+        f.write(triangles.data)
+def readMesh(path):
+    #zwraca (wierzchołki, trójkąty) jako tablice tylko do odczytu odwzorowane na plik
+    with open(path,'rb') as f:
+        magic,version,n,m=HEADER.unpack(f.read(HEADER.size))
+    if magic!=MAGIC or version!=VERSION:
+        raise ValueError("to nie jest plik siatki w wersji %d" % VERSION)
+    vertices=np.memmap(path,dtype='<f8',mode='r',offset=HEADER.size,shape=(n,2)) if n else np.empty((0,2))
+    triangles=np.memmap(path,dtype='<i4',mode='r',offset=HEADER.size+16*n,shape=(m,3)) if m else np.empty((0,3),dtype=np.int32)
+    return vertices,triangles
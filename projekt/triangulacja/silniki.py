@@ -0,0 +1,139 @@
+import math
+from collections import deque
+import numpy as np
+from .delaunay import delaunayFlip
+from .geometria import counterclockwise, extremes, monotoneDirection, orientation
+from .monotoniczne import Triangulate, triangulatePieces
+from .podzial import monotonicFaces
+from .predykaty import orient
+from .wektorowe import orientSigns
+from .wielokat import Polygon
+# Silniki triangulacji wielokąta prostego. Każdy silnik to funkcja
+# f(pS, imin, executor) przyjmująca wielokąt po getpoints (lista punktów albo
+# Polygon) i zwracająca tablicę int32 (m, 3) indeksów wierzchołków pS. Nowy
+# silnik wystarczy dopisać do słownika ENGINES. engine='auto' wybiera najtańszy
+# poprawny: wielokąt monotoniczny względem y albo innego kierunku trafia od razu
+# do Triangulate (O(n) po wyszukaniu kierunku w O(n log n)), pozostałe do
+# podziału miotłą na wielokąty monotoniczne (O(n log n)). Obcinanie uszu ('ears')
+# wybiera się jawnie.
+
+def monotoneEngine(pS,imin,executor=None):
+    #tylko dla wielokątów y-monotonicznych (monotonic(pS, imin))
+    return np.array(Triangulate(pS,imin),dtype=np.int32).reshape(-1,3)
+def directionEngine(pS,imin=None,executor=None):
+    #dla wielokątów monotonicznych względem kierunku z monotoneDirection
+    direction=monotoneDirection(pS)
+    if direction is None:
+        raise ValueError("wielokąt nie jest monotoniczny względem żadnego kierunku")
+    imax,imin=extremes(pS,direction)
+    return np.array(Triangulate(pS,imin,None,imax,direction),dtype=np.int32).reshape(-1,3)
+def sweepEngine(pS,imin,executor=None):
+    #podział przekątnymi (divide) i triangulacja ścian, z executorem równolegle
+    return triangulatePieces(pS,monotonicFaces(pS),executor)
+def earEngine(pS,imin=None,executor=None):
+    return earClipping(pS)
+ENGINES={'monotone':monotoneEngine,'direction':directionEngine,'sweep':sweepEngine,'ears':earEngine}
+
+def selectEngine(pS,imin):
+    #nazwa silnika dla engine='auto' - monotoniczność względem y (równoważna
+    #monotonic(pS, imin)), potem szukanie innego kierunku (monotoneDirection)
+    direction=monotoneDirection(pS)
+    if direction is None:
+        return 'sweep'
+    return 'monotone' if direction==(0.0,1.0) else 'direction'
+def triangulatePolygon(pS,imin,engine='auto',executor=None,delaunay=False):
+    #Triangulacja wielokąta prostego pS (po getpoints) wybranym silnikiem z ENGINES;
+    #zwraca tablicę int32 (m, 3) indeksów wierzchołków pS. delaunay=True poprawia
+    #wynik zamianami przekątnych (delaunay.delaunayFlip) - bez wąskich trójkątów.
+    #Wielokąt zgodny z ruchem wskazówek zegara jest triangulowany po odwróceniu
+    #(counterclockwise), a indeksy wracają do numeracji pS.
+    if engine!='auto' and engine not in ENGINES:
+        raise ValueError("nieznany silnik triangulacji: "+str(engine))
+    source=pS
+    pS,imin,flipped=counterclockwise(pS,imin)
+    if engine=='auto':
+        engine=selectEngine(pS,imin)
+    triangles=ENGINES[engine](pS,imin,executor)
+    if flipped:
+        triangles=(-triangles)%len(pS)
+    pS=source
+    if delaunay:
+        triangles,flips=delaunayFlip(pS,triangles)
+    return triangles
+
+def earClipping(pS):
+    #Triangulacja przez obcinanie uszu (dowolny obrót i orientacja pS). Wierzchołek
+    #wypukły jest uchem, gdy w jego trójkącie nie leży żaden wierzchołek wklęsły;
+    #wklęsłe wierzchołki są w siatce kubełków, więc test uch przegląda tylko
+    #kubełki pod prostokątem otaczającym trójkąt. Wierzchołek wypukły nie staje się
+    #wklęsły, a po obcięciu ucha zmienia się tylko stan jego dwóch sąsiadów.
+    pts=pS.points() if isinstance(pS,Polygon) else list(pS)
+    n=len(pts)
+    xy=np.asarray(pts,dtype=np.float64).reshape(-1,2)
+    if n<3:
+        return np.empty((0,3),dtype=np.int32)
+    s=orientation(xy)
+    prev=[n-1]+list(range(n-1))
+    nxt=list(range(1,n))+[0]
+    convex=(s*orientSigns(np.roll(xy,1,axis=0),xy,np.roll(xy,-1,axis=0))>0).tolist()
+    #siatka k x k kubełków z wierzchołkami wklęsłymi (i współliniowymi)
+    reflex=[i for i in range(n) if not convex[i]]
+    k=max(1,int(math.sqrt(len(reflex))))
+    x0,y0=xy.min(axis=0).tolist()
+    x1,y1=xy.max(axis=0).tolist()
+    w=(x1-x0)/k or 1.0
+    h=(y1-y0)/k or 1.0
+    cellX=lambda x: min(max(int((x-x0)/w),0),k-1)
+    cellY=lambda y: min(max(int((y-y0)/h),0),k-1)
+    buckets=[set() for _ in range(k*k)]
+    for i in reflex:
+        buckets[cellY(pts[i][1])*k+cellX(pts[i][0])].add(i)
+    def turn(i):
+        return s*orient(pts[prev[i]],pts[i],pts[nxt[i]])
+    def isEar(i):
+        a,c=prev[i],nxt[i]
+        A,B,C=pts[a],pts[i],pts[c]
+        left,right=min(A[0],B[0],C[0]),max(A[0],B[0],C[0])
+        bottom,top=min(A[1],B[1],C[1]),max(A[1],B[1],C[1])
+        for cy in range(cellY(bottom),cellY(top)+1):
+            for cx in range(cellX(left),cellX(right)+1):
+                for r in buckets[cy*k+cx]:
+                    P=pts[r]
+                    if r==a or r==c or P==A or P==C or not (left<=P[0]<=right and bottom<=P[1]<=top):
+                        continue
+                    if s*orient(A,B,P)>=0 and s*orient(B,C,P)>=0 and s*orient(C,A,P)>=0:
+                        return False
+        return True
+    ear=[convex[i] and isEar(i) for i in range(n)]
+    queue=deque(i for i in range(n) if ear[i])
+    removed=[False]*n
+    triangles=[]
+    remaining=n
+    while remaining>3:
+        if queue:
+            i=queue.popleft()
+            if removed[i] or not ear[i]:
+                continue
+        else:
+            #bez uszu zostają tylko wierzchołki współliniowe - obcinam trójkąt zerowy
+            i=next((j for j in range(n) if not removed[j] and turn(j)==0),None)
+            if i is None:
+                raise ValueError("wielokąt nie jest prosty")
+            if not convex[i]:
+                buckets[cellY(pts[i][1])*k+cellX(pts[i][0])].discard(i)
+        a,c=prev[i],nxt[i]
+        triangles.append((a,i,c))
+        removed[i]=True
+        remaining-=1
+        nxt[a]=c
+        prev[c]=a
+        for j in (a,c):
+            if not convex[j] and turn(j)>0:
+                convex[j]=True
+                buckets[cellY(pts[j][1])*k+cellX(pts[j][0])].discard(j)
+            ear[j]=convex[j] and isEar(j)
+            if ear[j]:
+                queue.append(j)
+    i=next(j for j in range(n) if not removed[j])
+    triangles.append((prev[i],i,nxt[i]))
+    return np.array(triangles,dtype=np.int32)
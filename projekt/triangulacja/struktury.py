@@ -0,0 +1,149 @@
+import random
+from .geometria import Det
+from .predykaty import orient
+from .wektorowe import Dets
+def xAt(edge,y):
+    #współrzędna x krawędzi na wysokości miotły y
+    (x1,y1),(x2,y2)=edge
+    if y1==y2:
+        return min(x1,x2)
+    return x1+(y-y1)*(x2-x1)/(y2-y1)
+def rightOf(edge,point):
+    #czy punkt leży ściśle na prawo od krawędzi - odporny test orientacji zamiast
+    #porównania z tolerancją, która zawodzi przy dużych współrzędnych
+    a,b=edge
+    if a[1]==b[1]:
+        return max(a[0],b[0])<point[0]
+    if a[1]>b[1]:
+        a,b=b,a
+    return orient(a,b,point)<0
+def edgeLess(e1,e2):
+    #Porównanie dwóch krawędzi obecnych jednocześnie w strukturze stanu.
+    #Krawędzie się nie przecinają, więc ich kolejność jest taka sama na całej
+    #wspólnej wysokości - porównuję je w połowie tego przedziału, żeby uniknąć
+    #remisów we wspólnych wierzchołkach.
+    low=max(min(e1[0][1],e1[1][1]),min(e2[0][1],e2[1][1]))
+    high=min(max(e1[0][1],e1[1][1]),max(e2[0][1],e2[1][1]))
+    y=(low+high)/2
+    x1,x2=xAt(e1,y),xAt(e2,y)
+    if x1!=x2:
+        return x1<x2
+    return e1<e2
+def segment(pS,edge):
+    #końce krawędzi o numerze edge, czyli odcinka pS[edge] - pS[edge+1]
+    return (pS[edge],pS[(edge+1)%len(pS)])
+# Węzeł drzewa Treap - kluczem jest krawędź (numer i jej końce), priorytet jest losowy.
+class _TreapNode:
+    __slots__=('edge','segment','priority','left','right')
+    def __init__(self,edge,segment):
+        self.edge=edge
+        self.segment=segment
+        self.priority=random.random()
+        self.left=None
+        self.right=None
+# Klasa StatusTree jest strukturą stanu miotły dla funkcji divide. Z zewnątrz
+# zachowuje się jak słownik krawędź -> pomocnik (helper), a dodatkowo trzyma
+# krawędzie w zrównoważonym drzewie (Treap) uporządkowanym według położenia na
+# miotle. Wstawianie, usuwanie i szukanie krawędzi na lewo od punktu kosztują
+# O(log n) zamiast liniowego przeglądania wszystkich kluczy jak w StatusDict.
+# Krawędzie i pomocnicy to numery krawędzi i wierzchołków wielokąta pS.
+class StatusTree:
+    def __init__(self,pS):
+        self.pS=pS
+        self.root=None
+        self.helpers={}
+
+    def __len__(self):
+        return len(self.helpers)
+
+    def __contains__(self,edge):
+        return edge in self.helpers
+
+    def get(self,edge):
+        return self.helpers.get(edge)
+
+    def __setitem__(self,edge,helper):
+        if edge not in self.helpers:
+            self.root=self._insert(self.root,_TreapNode(edge,segment(self.pS,edge)))
+        self.helpers[edge]=helper
+
+    def pop(self,edge):
+        helper=self.helpers.pop(edge)
+        self.root=self._remove(self.root,edge,segment(self.pS,edge))
+        return helper
+
+    # Metoda zwraca najbliższą krawędź leżącą na lewo od punktu.
+    def find_left(self,point):
+        node=self.root
+        cur_left=None
+        while node is not None:
+            if rightOf(node.segment,point):
+                cur_left=node.edge
+                node=node.right
+            else:
+                node=node.left
+        return cur_left
+
+    def _split(self,node,seg):
+        #dzieli drzewo na krawędzie mniejsze od odcinka seg i pozostałe
+        if node is None:
+            return None,None
+        if edgeLess(node.segment,seg):
+            node.right,right=self._split(node.right,seg)
+            return node,right
+        left,node.left=self._split(node.left,seg)
+        return left,node
+
+    def _merge(self,left,right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority>right.priority:
+            left.right=self._merge(left.right,right)
+            return left
+        right.left=self._merge(left,right.left)
+        return right
+
+    def _insert(self,node,new):
+        if node is None:
+            return new
+        if new.priority>node.priority:
+            new.left,new.right=self._split(node,new.segment)
+            return new
+        if edgeLess(new.segment,node.segment):
+            node.left=self._insert(node.left,new)
+        else:
+            node.right=self._insert(node.right,new)
+        return node
+
+    def _remove(self,node,edge,seg):
+        if node is None:
+            return None
+        if node.edge==edge:
+            return self._merge(node.left,node.right)
+        if edgeLess(seg,node.segment):
+            node.left=self._remove(node.left,edge,seg)
+        else:
+            node.right=self._remove(node.right,edge,seg)
+        return node
+# Klasa StatusDict to najprostsza struktura stanu: słownik krawędź -> pomocnik
+# z liniowym szukaniem krawędzi na lewo od punktu. Zostawiona do porównań z
+# StatusTree (benchmarki.miotla).
+class StatusDict(dict):
+    def __init__(self,pS):
+        super().__init__()
+        self.pS=pS
+
+    def find_left(self,point):
+        keys=list(self.keys())
+        cur_left=None
+        if not keys:
+            return cur_left
+        segments=[segment(self.pS,k) for k in keys]
+        right=(Dets([s[0] for s in segments],[s[1] for s in segments],[point]*len(keys))>10**(-12)).tolist()
+        for k,s,r in zip(keys,segments,right):
+            if r and (cur_left==None or Det(cur_seg[0],cur_seg[1],s[0])>10**(-12)):
+                cur_left = k
+                cur_seg = s
+        return cur_left
@@ -0,0 +1,101 @@
+import numpy as np
+from .predykaty import CCW_ERRBOUND, orientExact
+# Wersje wektorowe (numpy) funkcji z modułu geometria, działające na tablicy
+# punktów o kształcie (n, 2). Zamiast pętli po wierzchołkach liczą wszystko
+# naraz na przesuniętych tablicach poprzedników i następników.
+
+# Kody typów wierzchołków, w kolejności list zwracanych przez classify.
+BEGIN,END,DIVIDE,MERGE,DEFAULT=range(5)
+
+def _det(ax,ay,bx,by,cx,cy):
+    #Det(A,B,C) na kolumnach współrzędnych, w tej samej kolejności działań co w Det
+    return (ax*by+bx*cy+cx*ay)-(by*cx+cy*ax+ay*bx)
+def _orientSigns(ax,ay,bx,by,cx,cy):
+    #znaki Det z filtrem błędu jak w predykaty.orientFast; niepewne przypadki
+    #(zwykle bardzo nieliczne) są liczone dokładnie funkcją orientExact
+    detleft=(ax-cx)*(by-cy)
+    detright=(ay-cy)*(bx-cx)
+    det=detleft-detright
+    signs=np.sign(det).astype(np.int8)
+    errbound=CCW_ERRBOUND*(np.abs(detleft)+np.abs(detright))
+    for i in np.flatnonzero(np.abs(det)<errbound).tolist():
+        signs[i]=orientExact((ax[i],ay[i]),(bx[i],by[i]),(cx[i],cy[i]))
+    return signs
+def orientSigns(A,B,C):
+    #odporne znaki Det dla tablic (m, 2) punktów A, B, C
+    A=np.asarray(A,dtype=np.float64)
+    B=np.asarray(B,dtype=np.float64)
+    C=np.asarray(C,dtype=np.float64)
+    return _orientSigns(A[:,0],A[:,1],B[:,0],B[:,1],C[:,0],C[:,1])
+def Dets(A,B,C):
+    #Det dla wielu trójek naraz - A, B, C to tablice (m, 2) punktów
+    A=np.asarray(A,dtype=np.float64)
+    B=np.asarray(B,dtype=np.float64)
+    C=np.asarray(C,dtype=np.float64)
+    return _det(A[:,0],A[:,1],B[:,0],B[:,1],C[:,0],C[:,1])
+def orientations(points,triples):
+    #znaki Det (-1, 0, 1) dla trójek indeksów (m, 3) do wspólnej tablicy punktów
+    pts=np.asarray(points,dtype=np.float64)
+    t=np.asarray(triples,dtype=np.intp)
+    x=pts[:,0]
+    y=pts[:,1]
+    a,b,c=t[:,0],t[:,1],t[:,2]
+    return _orientSigns(x[a],y[a],x[b],y[b],x[c],y[c])
+def levels(points,direction=None):
+    #Klucze porządku wierzchołków "wyżej - niżej" jako liczby zespolone wysokość+1j*x:
+    #numpy porównuje i sortuje je leksykograficznie, więc przy równych wysokościach
+    #wyżej jest wierzchołek o większym x (dla kierunku direction - o większym rzucie
+    #na kierunek do niego prostopadły, (dy, -dx)). Porządek jest ścisły, jak po
+    #obrocie kierunku o nieskończenie mały kąt - żadna krawędź nie jest pozioma.
+    pts=np.asarray(points,dtype=np.float64).reshape(-1,2)
+    if direction is None:
+        return pts[:,1]+1j*pts[:,0]
+    dx,dy=direction
+    return pts@np.array([dx,dy])+1j*(pts@np.array([dy,-dx]))
+# Liczba wierzchołków klasyfikowanych naraz w vertexTypes - ogranicza rozmiar
+# tablic pomocniczych przy bardzo dużych wielokątach.
+CHUNK=1<<14
+
+def _types(pts,k):
+    #typy wierzchołków (paczkami CHUNK) dla kluczy k z levels
+    n=len(pts)
+    types=np.empty(n,dtype=np.int8)
+    for start in range(0,n,CHUNK):
+        i=np.arange(start,min(start+CHUNK,n))
+        j=i-1
+        l=(i+1)%n
+        d=_orientSigns(pts[j,0],pts[j,1],pts[i,0],pts[i,1],pts[l,0],pts[l,1])
+        ki,kp,kn=k[i],k[j],k[l]
+        above=(ki>kp)&(ki>kn)
+        below=(ki<kp)&(ki<kn)
+        #dla ekstremów lokalnych kod to 2*(kąt wklęsły)+(minimum): BEGIN, END, DIVIDE, MERGE
+        types[i]=np.where(above|below,2*(d<0)+below,DEFAULT)
+    return types
+def _monotone(k):
+    #czy obwód w porządku kluczy k tylko raz idzie w dół i raz w górę (powtórzone
+    #punkty są pomijane)
+    nxt=np.roll(k,-1)
+    steps=(nxt>k).astype(np.int8)-(nxt<k)
+    steps=steps[steps!=0]
+    return int(np.count_nonzero(steps!=np.roll(steps,1)))<=2
+def vertexTypes(points):
+    #typ każdego wierzchołka wielokąta jako tablica kodów BEGIN..DEFAULT; równe y
+    #rozstrzyga x (levels)
+    pts=np.asarray(points,dtype=np.float64).reshape(-1,2)
+    return _types(pts,levels(pts))
+def vertexScan(points,direction=None):
+    #Wszystko, czego potrzeba do wyboru drogi triangulacji, z jednych kluczy levels
+    #(wysokość - rzut na wektor direction, domyślnie y - a przy remisach x):
+    #(types, imax, imin, monotone) - typy jak w vertexTypes, indeksy najwyższego i
+    #najniższego wierzchołka oraz czy wielokąt jest monotoniczny, tzn. wzdłuż obwodu
+    #tylko raz idzie w dół i raz w górę. Typy można przekazać dalej do divide.
+    pts=np.asarray(points,dtype=np.float64).reshape(-1,2)
+    k=levels(pts,direction)
+    return _types(pts,k),int(np.argmax(k)),int(np.argmin(k)),_monotone(k)
+def classifyVectorized(points):
+    #odpowiednik classify zwracający tablice indeksów wierzchołków
+    #początkowych, końcowych, dzielących, łączących i prawidłowych
+    types=vertexTypes(points)
+    order=np.argsort(types,kind='stable')
+    bounds=np.cumsum(np.bincount(types,minlength=5))[:-1]
+    return tuple(np.split(order,bounds))
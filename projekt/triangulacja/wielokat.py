@@ -0,0 +1,59 @@
+import numpy as np
+# Klasa Polygon przechowuje wielokąt w zwartej postaci: współrzędne w jednej
+# ciągłej tablicy float64 o kształcie (n, 2) oraz numery wierzchołków w
+# wielokącie wyjściowym w tablicy int32 (wielokąty powstałe z podziału dzielą
+# tę numerację z rodzicem). To ok. 20 bajtów na wierzchołek zamiast ponad 100
+# bajtów listy krotek (x, y). Funkcje getpoints, classify, divide,
+# makeMonotonicTab i Triangulate przyjmują Polygon zamiennie z listą punktów;
+# pS[i] zwraca krotkę (x, y) tworzoną dopiero przy odwołaniu.
+class Polygon:
+    __slots__=('xy','index')
+    def __init__(self,points,index=None):
+        self.xy=np.ascontiguousarray(points,dtype=np.float64).reshape(-1,2)
+        if index is None:
+            index=np.arange(len(self.xy),dtype=np.int32)
+        self.index=np.ascontiguousarray(index,dtype=np.int32)
+
+    def __len__(self):
+        return len(self.xy)
+
+    def __getitem__(self,i):
+        return (self.xy.item(i,0),self.xy.item(i,1))
+
+    def __iter__(self):
+        for i in range(len(self.xy)):
+            yield self[i]
+
+    def __array__(self,dtype=None,copy=None):
+        #copy=True (np.array(polygon)) daje kopię - zmiany nie trafiają do self.xy
+        if dtype is None:
+            return self.xy.copy() if copy else self.xy
+        return self.xy.astype(dtype,copy=bool(copy))
+
+    @property
+    def x(self):
+        return self.xy[:,0]
+
+    @property
+    def y(self):
+        return self.xy[:,1]
+
+    # Metoda zwraca wielokąt złożony z wierzchołków o podanych indeksach.
+    def take(self,indices):
+        indices=np.asarray(indices,dtype=np.intp)
+        return Polygon(self.xy[indices],self.index[indices])
+
+    # Metoda zwraca ten sam wielokąt zaczynający się od wierzchołka k.
+    def rotated(self,k):
+        return Polygon(np.roll(self.xy,-k,axis=0),np.roll(self.index,-k))
+
+    def points(self):
+        return [tuple(p) for p in self.xy.tolist()]
+
+    def nbytes(self):
+        return self.xy.nbytes+self.index.nbytes
+def subPolygon(pS,indices):
+    #wielokąt z wierzchołków pS o podanych indeksach - Polygon albo lista punktów
+    if isinstance(pS,Polygon):
+        return pS.take(indices)
+    return [pS[i] for i in indices]
@@ -0,0 +1,416 @@
+import json as js
+import math
+# Moduł odpowiada za wizualizację (sceny, kolekcje punktów i odcinków, wykres
+# z przyciskami). Biblioteki matplotlib i numpy są importowane dopiero w
+# metodach, które ich potrzebują, dzięki czemu samo zaimportowanie modułu (np.
+# przez funkcje budujące sceny) nie otwiera okna i nie kosztuje ładowania
+# matplotliba.
+
+# Parametr określający jak blisko (w odsetku całego widocznego zakresu) punktu początkowego 
+# wielokąta musimy kliknąć, aby go zamknąć.
+TOLERANCE = 0.15
+
+def dist(point1, point2):
+    return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
+
+# Klasa _Renderer rysuje sceny na osiach bez ich czyszczenia. Dla każdej kolekcji
+# punktów i odcinków tworzy raz artystę (scatter / LineCollection), a przy
+# kolejnych scenach tylko podmienia jego dane (set_offsets / set_segments); nowy
+# artysta powstaje jedynie wtedy, gdy zmienił się styl kolekcji. Elementy
+# dodawane myszką są artystami animowanymi - przy kliknięciu odtwarzane jest
+# zapamiętane tło osi i dorysowywane są tylko one (blitting), zamiast
+# przerysowywać cały wykres.
+class _Renderer:
+    def __init__(self, ax):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.blitting = self.canvas.supports_blit
+        self.points = []
+        self.lines = []
+        self.overlay_points = []
+        self.overlay_lines = []
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    # Metoda dopasowuje listę artystów [artysta, kwargs, współrzędne] do listy
+    # kolekcji; współrzędne (tablica (k, 2)) służą potem do autoskalowania.
+    def _sync(self, artists, collections, data, make, update, animated):
+        for k, collection in enumerate(collections):
+            xy = data(collection)
+            if k < len(artists) and artists[k][1] == collection.kwargs:
+                update(artists[k][0], xy)
+                artists[k][0].set_visible(True)
+                artists[k][2] = xy
+                continue
+            artist = make(collection, xy)
+            artist.set_animated(animated and self.blitting)
+            if k < len(artists):
+                artists[k][0].remove()
+                artists[k] = [artist, collection.kwargs, xy]
+            else:
+                artists.append([artist, collection.kwargs, xy])
+        for artist, kwargs, xy in artists[len(collections):]:
+            artist.set_visible(False)
+
+    def _sync_points(self, artists, collections, animated):
+        import numpy as np
+        def data(collection):
+            return np.asarray(collection.points, dtype=float).reshape(-1, 2)
+        def make(collection, xy):
+            return self.ax.scatter(xy[:, 0], xy[:, 1], **collection.kwargs)
+        self._sync(artists, collections, data, make, lambda artist, xy: artist.set_offsets(xy), animated)
+
+    def _sync_lines(self, artists, collections, animated):
+        import numpy as np
+        def data(collection):
+            return np.asarray(collection.lines, dtype=float).reshape(-1, 2, 2)
+        def make(collection, segments):
+            return self.ax.add_collection(collection.get_collection(), autolim=False)
+        self._sync(artists, collections, data, make, lambda artist, segments: artist.set_segments(segments), animated)
+
+    # Metoda ustawia zakres osi na podstawie danych widocznych artystów - tak jak
+    # autoskalowanie po narysowaniu wszystkiego od nowa.
+    def _autoscale(self):
+        from matplotlib.transforms import Bbox
+        self.ax.dataLim.set(Bbox.null())
+        self.ax.ignore_existing_data_limits = True
+        for artist, kwargs, xy in self.points + self.overlay_points + self.lines + self.overlay_lines:
+            if artist.get_visible() and xy.size > 0:
+                self.ax.update_datalim(xy.reshape(-1, 2))
+        self.ax.autoscale(True)
+
+    # Metoda rysuje scenę i elementy dodane myszką. Przy incremental=True scena
+    # się nie zmieniła, więc aktualizowane są tylko elementy dodane myszką.
+    # render=False tylko ustawia elementy wykresu bez przerysowania płótna - przy
+    # zapisie do pliku i tak rysuje je savefig.
+    def draw(self, scene, added_points, added_lines, autoscaling, incremental, render = True):
+        if not incremental:
+            self._sync_points(self.points, scene.points, False)
+            self._sync_lines(self.lines, scene.lines, False)
+        self._sync_points(self.overlay_points, added_points, True)
+        self._sync_lines(self.overlay_lines, added_lines, True)
+        if autoscaling:
+            self._autoscale()
+        else:
+            self.ax.set_autoscale_on(False)
+        if incremental and self.blitting and self.background is not None:
+            self.canvas.restore_region(self.background)
+            self._draw_overlay()
+            self.canvas.blit(self.ax.bbox)
+        elif render:
+            self.canvas.draw_idle()
+
+    def _draw_overlay(self):
+        for artist, kwargs, xy in self.overlay_points + self.overlay_lines:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    # Po każdym pełnym przerysowaniu zapamiętujemy tło (bez elementów animowanych)
+    # i dorysowujemy na nim elementy dodane myszką.
+    def on_draw(self, event):
+        if self.blitting:
+            self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self._draw_overlay()
+
+# Klasa ta trzyma obecny stan wykresu oraz posiada metody, które mają zostać wykonane
+# po naciśnięciu przycisków. Sceny mogą być zwykłą listą albo obiektem
+# sceny.DeltaScenes - wtedy scena jest odtwarzana z przyrostów dopiero przy
+# odwołaniu self.scenes[self.i]. Rysowaniem zajmuje się _Renderer.
+class _Button_callback(object):
+    def __init__(self, scenes):
+        self.i = 0
+        self.scenes = scenes
+        self.adding_points = False
+        self.added_points = []
+        self.adding_lines = False
+        self.added_lines = []
+        self.adding_rects = False
+        self.added_rects = []
+
+    def set_axes(self, ax):
+        self.ax = ax
+        self.renderer = _Renderer(ax)
+        
+    # Metoda ta obsługuje logikę przejścia do następnej sceny.
+    def next(self, event):
+        self.i = (self.i + 1) % len(self.scenes)
+        self.draw(autoscaling = True)
+
+    # Metoda ta obsługuje logikę powrotu do poprzedniej sceny.
+    def prev(self, event):
+        self.i = (self.i - 1) % len(self.scenes)
+        self.draw(autoscaling = True)
+        
+    # Metoda ta aktywuje funkcję rysowania punktów wyłączając równocześnie rysowanie 
+    # odcinków i wielokątów.
+    def add_point(self, event):
+        self.adding_points = not self.adding_points
+        self.new_line_point = None
+        if self.adding_points:
+            self.adding_lines = False
+            self.adding_rects = False
+            self.added_points.append(PointsCollection([]))
+            
+    # Metoda ta aktywuje funkcję rysowania odcinków wyłączając równocześnie
+    # rysowanie punktów i wielokątów.     
+    def add_line(self, event):   
+        self.adding_lines = not self.adding_lines
+        self.new_line_point = None
+        if self.adding_lines:
+            self.adding_points = False
+            self.adding_rects = False
+            self.added_lines.append(LinesCollection([]))
+
+    # Metoda ta aktywuje funkcję rysowania wielokątów wyłączając równocześnie
+    # rysowanie punktów i odcinków.
+    def add_rect(self, event):
+        self.adding_rects = not self.adding_rects
+        self.new_line_point = None
+        if self.adding_rects:
+            self.adding_points = False
+            self.adding_lines = False
+            self.new_rect()
+    
+    def new_rect(self):
+        self.added_rects.append(LinesCollection([]))
+        self.rect_points = []
+        
+    # Metoda odpowiedzialna za właściwą logikę rysowania nowych elementów. W
+    # zależności od włączonego trybu dodaje nowe punkty, początek, koniec odcinka
+    # lub poszczególne wierzchołki wielokąta. Istnieje ciekawa logika sprawdzania
+    # czy dany punkt jest domykający dla danego wielokąta. Polega ona na tym, że
+    # sprawdzamy czy odległość nowego punktu od początkowego jest większa od
+    # średniej długości zakresu pomnożonej razy parametr TOLERANCE.   
+    def on_click(self, event):
+        import numpy as np
+        if event.inaxes != self.ax:
+            return
+        new_point = (event.xdata, event.ydata)
+        if self.adding_points:
+            self.added_points[-1].add_points([new_point])
+            self.draw(autoscaling = False, incremental = True)
+        elif self.adding_lines:
+            if self.new_line_point is not None:
+                self.added_lines[-1].add([self.new_line_point, new_point])
+                self.new_line_point = None
+                self.draw(autoscaling = False, incremental = True)
+            else:
+                self.new_line_point = new_point
+        elif self.adding_rects:
+            if len(self.rect_points) == 0:
+                self.rect_points.append(new_point)
+            elif len(self.rect_points) == 1:
+                self.added_rects[-1].add([self.rect_points[-1], new_point])
+                self.rect_points.append(new_point)
+                self.draw(autoscaling = False, incremental = True)
+            elif len(self.rect_points) > 1:
+                if dist(self.rect_points[0], new_point) < (np.mean([self.ax.get_xlim(), self.ax.get_ylim()])*TOLERANCE):
+                    self.added_rects[-1].add([self.rect_points[-1], self.rect_points[0]])
+                    self.new_rect()
+                else:    
+                    self.added_rects[-1].add([self.rect_points[-1], new_point])
+                    self.rect_points.append(new_point)
+                self.draw(autoscaling = False, incremental = True)
+    
+    # Metoda odpowiedzialna za narysowanie całego wykresu. Artyści z poprzedniego
+    # rysowania są używani ponownie (_Renderer), a przy incremental=True - po
+    # kliknięciu w trybie dodawania - przerysowywane są tylko dodane elementy.
+    # Przy autoscaling=False zakres osi zostaje bez zmian, żeby dodawanie
+    # nowych punktów przy brzegu obecnie widzianego zakresu nie powodowało
+    # niekorzystnego przeskalowania.
+    def draw(self, autoscaling = True, incremental = False):
+        self.renderer.draw(self.scenes[self.i], self.added_points, self.added_lines + self.added_rects, autoscaling, incremental)
+# Klasa Scene odpowiada za przechowywanie elementów, które mają być
+# wyświetlane równocześnie. Konkretnie jest to lista PointsCollection i
+# LinesCollection.
+class Scene:
+    def __init__(self, points=[], lines=[]):
+        self.points=points
+        self.lines=lines
+
+# Klasa _GrowingArray przechowuje elementy kolekcji w tablicy numpy z zapasem
+# miejsca na końcu: po przepełnieniu pojemność rośnie dwukrotnie, więc dopisanie
+# elementu kosztuje zamortyzowane O(1) zamiast kopiowania całej listy. Widok
+# wypełnionej części jest zapamiętywany i unieważniany tylko przy dopisaniu.
+# Przekazana tablica nie jest kopiowana - pierwsze dopisanie i tak przenosi dane
+# do nowego bufora, więc dane wejściowe nigdy nie są modyfikowane.
+class _GrowingArray:
+    def __init__(self, items, shape):
+        import numpy as np
+        self.shape = shape
+        self.data = np.asarray(items, dtype=float).reshape((-1,) + shape)
+        self.size = len(self.data)
+        self.cached = None
+
+    def extend(self, items):
+        import numpy as np
+        items = np.asarray(items, dtype=float).reshape((-1,) + self.shape)
+        size = self.size + len(items)
+        if size > len(self.data):
+            grown = np.empty((max(size, 2 * len(self.data), 16),) + self.shape)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:size] = items
+        self.size = size
+        self.cached = None
+
+    def view(self):
+        if self.cached is None:
+            self.cached = self.data[:self.size]
+        return self.cached
+
+# Klasa PointsCollection gromadzi w sobie punkty jednego typu, a więc takie,
+# które zostaną narysowane w takim samym kolorze i stylu. W konstruktorze
+# przyjmuje listę punktów rozumianych jako pary współrzędnych (x, y). Parametr
+# kwargs jest przekazywany do wywołania funkcji z biblioteki MatPlotLib przez
+# co użytkownik może podawać wszystkie parametry tam zaproponowane. Punkty są
+# trzymane w _GrowingArray, a atrybut points zwraca je jako tablicę (n, 2).
+class PointsCollection:
+    def __init__(self, points, **kwargs):
+        self.buffer = _GrowingArray(points, (2,))
+        self.kwargs = kwargs
+
+    @property
+    def points(self):
+        return self.buffer.view()
+
+    def add_points(self, points):
+        self.buffer.extend(points)
+
+# Klasa LinesCollection podobnie jak jej punktowy odpowiednik gromadzi
+# odcinki tego samego typu. Tworząc ją należy podać listę linii, gdzie każda
+# z nich jest dwuelementową listą punktów – par (x, y). Parametr kwargs jest
+# przekazywany do wywołania funkcji z biblioteki MatPlotLib przez co użytkownik
+# może podawać wszystkie parametry tam zaproponowane. Atrybut lines zwraca
+# odcinki jako tablicę (n, 2, 2).
+class LinesCollection:
+    def __init__(self, lines, **kwargs):
+        self.buffer = _GrowingArray(lines, (2, 2))
+        self.kwargs = kwargs
+
+    @property
+    def lines(self):
+        return self.buffer.view()
+
+    def add(self, line):
+        self.buffer.extend(line)
+        
+    def get_collection(self):
+        import matplotlib.collections as mcoll
+        return mcoll.LineCollection(self.lines, **self.kwargs)
+
+# Klasa Plot jest najważniejszą klasą w całym programie, ponieważ agreguje
+# wszystkie przygotowane sceny, odpowiada za stworzenie wykresu i przechowuje
+# referencje na przyciski, dzięki czemu nie będą one skasowane podczas tzw.
+# garbage collectingu.
+class Plot:
+    def __init__(self, scenes = [Scene()], points = [], lines = [], json = None, archive = None):
+        if archive is not None:
+            from .archiwum import loadScenes
+            self.scenes = loadScenes(archive)
+        elif json is None:
+            self.scenes = scenes
+            if points or lines:
+                self.scenes[0].points = points
+                self.scenes[0].lines = lines
+        else:
+            self.scenes = [Scene([PointsCollection(pointsCol) for pointsCol in scene["points"]], 
+                                 [LinesCollection(linesCol) for linesCol in scene["lines"]]) 
+                           for scene in js.loads(json)]
+    
+    # Ta metoda ma szczególne znaczenie, ponieważ konfiguruje przyciski i
+    # wykonuje tym samym dość skomplikowaną logikę. Zauważmy, że konfigurując każdy
+    # przycisk podajemy referencję na metodę obiektu _Button_callback, która
+    # zostanie wykonana w momencie naciśnięcia.
+    def __configure_buttons(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Button
+        plt.subplots_adjust(bottom=0.2)
+        ax_prev = plt.axes([0.6, 0.05, 0.15, 0.075])
+        ax_next = plt.axes([0.76, 0.05, 0.15, 0.075])
+        ax_add_point = plt.axes([0.44, 0.05, 0.15, 0.075])
+        ax_add_line = plt.axes([0.28, 0.05, 0.15, 0.075])
+        ax_add_rect = plt.axes([0.12, 0.05, 0.15, 0.075])
+        b_next = Button(ax_next, 'Następny')
+        b_next.on_clicked(self.callback.next)
+        b_prev = Button(ax_prev, 'Poprzedni')
+        b_prev.on_clicked(self.callback.prev)
+        b_add_point = Button(ax_add_point, 'Dodaj punkt')
+        b_add_point.on_clicked(self.callback.add_point)
+        b_add_line = Button(ax_add_line, 'Dodaj linię')
+        b_add_line.on_clicked(self.callback.add_line)
+        b_add_rect = Button(ax_add_rect, 'Dodaj figurę')
+        b_add_rect.on_clicked(self.callback.add_rect)
+        return [b_prev, b_next, b_add_point, b_add_line, b_add_rect]
+    
+    def add_scene(self, scene):
+        self.scenes.append(scene)
+    
+    def add_scenes(self, scenes):
+        self.scenes = self.scenes + scenes
+
+    # Metoda toJson() odpowiada za zapisanie stanu obiektu do ciągu znaków w
+    # formacie JSON.
+    def toJson(self):
+        import numpy as np
+        return js.dumps([{"points": [np.array(pointCol.points).tolist() for pointCol in scene.points], 
+                          "lines":[np.array(linesCol.lines).tolist() for linesCol in scene.lines]} 
+                         for scene in self.scenes])    
+
+    # Metoda saveArchive() zapisuje sceny do binarnego archiwum (moduł archiwum),
+    # które Plot(archive=...) wczytuje scena po scenie. JSON zostaje jako format
+    # wymiany danych.
+    def saveArchive(self, path):
+        from .archiwum import saveScenes
+        saveScenes(path, self.scenes)
+
+    # Metoda export() rysuje wszystkie sceny bez okna (moduł eksport): do pliku
+    # .gif/.mp4 albo, gdy path nie ma rozszerzenia, do katalogu z klatkami PNG.
+    def export(self, path, fps = 5, executor = None, **options):
+        import os
+        from .eksport import exportFrames, exportVideo
+        if os.path.splitext(path)[1]:
+            return exportVideo(self.scenes, path, fps, executor, **options)
+        return exportFrames(self.scenes, path, executor, **options)
+    
+    # Metoda ta zwraca punkty dodane w trakcie rysowania.
+    def get_added_points(self):
+        if self.callback:
+            return self.callback.added_points
+        else:
+            return None
+    
+    # Metoda ta zwraca odcinki dodane w trakcie rysowania.
+    def get_added_lines(self):
+        if self.callback:
+            return self.callback.added_lines
+        else:
+            return None
+        
+    # Metoda ta zwraca wielokąty dodane w trakcie rysowania.
+    def get_added_figure(self):
+        if self.callback:
+            return self.callback.added_rects
+        else:
+            return None
+    
+    # Metoda ta zwraca punkty, odcinki i wielokąty dodane w trakcie rysowania
+    # jako scenę.
+    def get_added_elements(self):
+        if self.callback:
+            return Scene(self.callback.added_points, self.callback.added_lines+self.callback.added_rects)
+        else:
+            return None
+    
+    # Główna metoda inicjalizująca wyświetlanie wykresu.
+    def draw(self):
+        import matplotlib.pyplot as plt
+        plt.close()
+        fig = plt.figure()
+        self.callback = _Button_callback(self.scenes)
+        self.widgets = self.__configure_buttons()
+        ax = plt.axes(autoscale_on = False)
+        self.callback.set_axes(ax)
+        fig.canvas.mpl_connect('button_press_event', self.callback.on_click)
+        plt.show()
+        self.callback.draw()
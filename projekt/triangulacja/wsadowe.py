@@ -0,0 +1,138 @@
+import os
+import numpy as np
+from .monotoniczne import _triangulateOrdered
+from .podzial import monotonicFaces
+from .wektorowe import _orientSigns, levels
+# Triangulacja wielu wielokątów jednym wywołaniem. Wielokąty są podane jako
+# tablica "postrzępiona": współrzędne wszystkich wierzchołków jeden wielokąt po
+# drugim oraz tablica offsets, w której wielokąt k to coords[offsets[k]:offsets[k+1]].
+# Wszystko, co da się policzyć naraz dla całej tablicy (orientacja, wierzchołki
+# dzielące i łączące, trójkąty, uszeregowanie wierzchołków), liczone jest wektorowo;
+# wielokąty monotoniczne są triangulowane bez podziału przekątnymi. Wierzchołki są
+# porządkowane jak w wektorowe.levels - po y, a przy równych y po x - tak samo w
+# klasyfikacji, w divide i w _chainOrders, więc poziome krawędzie (np. obrysy
+# budynków w kształcie T, U, H) nie wymagają osobnej obsługi.
+
+def _ranges(starts,counts):
+    #połączone przedziały starts[k] .. starts[k]+counts[k]-1
+    total=int(counts.sum())
+    firsts=np.repeat(np.cumsum(counts)-counts,counts)
+    return np.repeat(starts,counts)+np.arange(total)-firsts
+def _chainOrders(xy,offsets):
+    #chainOrder dla wielu wielokątów monotonicznych naraz - jedno sortowanie zamiast
+    #osobnych wywołań. Zwraca scaloną kolejność (indeksy do xy, wielokąt po
+    #wielokącie) i przynależność każdego wierzchołka do lewego łańcucha.
+    lengths=np.diff(offsets)
+    poly=np.repeat(np.arange(len(lengths)),lengths)
+    j=np.arange(len(xy))-offsets[poly]
+    x,y=xy[:,0],xy[:,1]
+    imax=np.lexsort((j,-x,-y,poly))[offsets[:-1]]-offsets[:-1]
+    imin=np.lexsort((j,x,y,poly))[offsets[:-1]]-offsets[:-1]
+    k=np.where(imax<imin,imin-imax,lengths-imax+imin)
+    size=lengths[poly]
+    rel=(j-imax[poly])%size
+    isLeft=rel<k[poly]
+    #pozycja w łańcuchu licząc od góry (po y, potem po x); przy równych punktach
+    #pierwszy jest prawy łańcuch
+    return np.lexsort((np.where(isLeft,rel,size-1-rel),isLeft,-x,-y,poly)),isLeft
+def _triangulateRange(xy,offsets,monotone):
+    #trójkąty wielokątów xy[offsets[k]:offsets[k+1]] (przeciwnie do ruchu wskazówek
+    #zegara) jako tablica int32 (T, 3) indeksów do xy, wielokąt po wielokącie.
+    #Wielokąty niemonotoniczne są najpierw dzielone na ściany monotoniczne, potem
+    #wszystkie kawałki dostają kolejność wierzchołków z _chainOrders, a w pętli
+    #zostaje tylko przejście stosem.
+    pts=list(zip(xy[:,0].tolist(),xy[:,1].tolist()))
+    bounds=offsets.tolist()
+    ids=[]
+    sizes=[]
+    for p in range(len(bounds)-1):
+        s,e=bounds[p],bounds[p+1]
+        if monotone[p]:
+            ids+=range(s,e)
+            sizes.append(e-s)
+            continue
+        #divide zaczyna od najwyższego wierzchołka (levels)
+        top=s+int(np.argmax(levels(xy[s:e])))
+        rotated=pts[top:e]+pts[s:top]
+        for face in monotonicFaces(rotated):
+            ids+=[top+i if top+i<e else top+i-(e-s) for i in face]
+            sizes.append(len(face))
+    ids=np.array(ids,dtype=np.intp)
+    pieces=np.zeros(len(sizes)+1,dtype=np.int64)
+    np.cumsum(sizes,out=pieces[1:])
+    merged,isLeft=_chainOrders(xy[ids],pieces)
+    vertices=memoryview(merged)
+    flags=isLeft.tobytes()
+    local=[pts[i] for i in ids.tolist()]
+    triangles=[]
+    bounds=pieces.tolist()
+    for p in range(len(sizes)):
+        triangles+=_triangulateOrdered(local,vertices[bounds[p]:bounds[p+1]],flags)
+    return ids[np.array(triangles,dtype=np.intp).reshape(-1,3)].astype(np.int32)
+def triangulateBatch(coords,offsets,executor=None,chunks=None):
+    #Triangulacja wielokątów coords[offsets[k]:offsets[k+1]] (dowolnie zorientowanych).
+    #Zwraca (triangles, toffsets): tablicę int32 (T, 3) indeksów do coords i tablicę
+    #toffsets, w której trójkąty wielokąta k to triangles[toffsets[k]:toffsets[k+1]]
+    #(wielokąt o k wierzchołkach ma k-2 trójkąty). Z executorem z concurrent.futures
+    #paczki wielokątów są triangulowane równolegle.
+    xy=np.ascontiguousarray(coords,dtype=np.float64).reshape(-1,2)
+    offsets=np.asarray(offsets,dtype=np.int64)
+    sizes=np.diff(offsets)
+    count=np.maximum(sizes-2,0)
+    toffsets=np.zeros(len(sizes)+1,dtype=np.int64)
+    np.cumsum(count,out=toffsets[1:])
+    triangles=np.empty((int(toffsets[-1]),3),dtype=np.int32)
+    valid=np.flatnonzero(sizes>=3)
+    if len(valid)==0:
+        return triangles,toffsets
+    #wierzchołki poprawnych wielokątów ułożone jeden za drugim (pozycje j w tym
+    #zwartym układzie, idx - indeksy do coords) oraz ich sąsiedzi w wielokącie
+    starts,lengths=offsets[valid],sizes[valid]
+    cstarts=np.cumsum(lengths)-lengths
+    idx=_ranges(starts,lengths)
+    j=np.arange(len(idx))
+    cfirst=np.repeat(cstarts,lengths)
+    clast=cfirst+np.repeat(lengths,lengths)-1
+    prv=np.where(j==cfirst,clast,j-1)
+    nxt=np.where(j==clast,cfirst,j+1)
+    #orientacja: wielokąty zgodne z ruchem wskazówek zegara są obchodzone wstecz;
+    #współrzędne względem pierwszego wierzchołka wielokąta, bo przy dużych
+    #(np. UTM) suma pól traci znak przez odejmowanie bliskich iloczynów
+    x=xy[idx,0]-xy[idx[cfirst],0]
+    y=xy[idx,1]-xy[idx[cfirst],1]
+    ccw=np.add.reduceat(x*y[nxt]-x[nxt]*y,cstarts)>0
+    order=np.where(np.repeat(ccw,lengths),idx,idx[cfirst+clast-j])
+    ox,oy=xy[order,0],xy[order,1]
+    px,py=ox[prv],oy[prv]
+    nx,ny=ox[nxt],oy[nxt]
+    #wierzchołki dzielące i łączące (ekstrema lokalne z kątem wklęsłym) - wielokąt
+    #bez nich jest y-monotoniczny i nie wymaga podziału; równe y rozstrzyga x
+    d=_orientSigns(px,py,ox,oy,nx,ny)
+    k,kp,kn=oy+1j*ox,py+1j*px,ny+1j*nx
+    extremum=((k>kp)&(k>kn))|((k<kp)&(k<kn))
+    bad=np.add.reduceat((extremum&(d<0)).astype(np.int64),cstarts)
+    monotone=bad==0
+    #trójkąty wprost
+    small=lengths==3
+    triangles[toffsets[valid[small]]]=order[_ranges(cstarts[small],lengths[small])].reshape(-1,3)
+    #pozostałe wielokąty w paczkach
+    hard=np.flatnonzero(~small)
+    if len(hard)==0:
+        return triangles,toffsets
+    if executor is None:
+        chunks=1
+    elif chunks is None:
+        chunks=4*(os.cpu_count() or 1)
+    futures=[]
+    for part in np.array_split(hard,min(chunks,len(hard))):
+        sel=_ranges(cstarts[part],lengths[part])
+        partOffsets=np.zeros(len(part)+1,dtype=np.int64)
+        np.cumsum(lengths[part],out=partOffsets[1:])
+        args=(np.stack([ox[sel],oy[sel]],axis=1),partOffsets,monotone[part])
+        result=_triangulateRange(*args) if executor is None else executor.submit(_triangulateRange,*args)
+        futures.append((part,sel,result))
+    for part,sel,result in futures:
+        if executor is not None:
+            result=result.result()
+        triangles[_ranges(toffsets[valid[part]],count[valid[part]])]=order[sel][result]
+    return triangles,toffsets